@@ -5,12 +5,14 @@ import re
 from pathlib import Path
 from typing import Any
 
-from PySide6.QtCore import QObject, QTimer, Signal
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QObject, Qt, QThread, QTimer, Signal, Slot
 
 from .spectrum import SpectrumAnalyzer
 
 
 _SPECTRUM_MAG_RE = re.compile(r"magnitude=\(float\)\{([^}]*)\}")
+_EQ_BAND_NAMES = tuple(f"band{i}" for i in range(10))
 
 try:
     import gi  # type: ignore
@@ -24,24 +26,81 @@ except Exception:
     GST_AVAILABLE = False
 
 
+def _extract_magnitudes(structure: Any) -> np.ndarray:
+    # Most runtimes expose "magnitude" as an iterable value.
+    try:
+        raw = structure.get_value("magnitude")
+        return np.fromiter(raw, dtype=np.float32)
+    except Exception:
+        pass
+
+    # GNOME/Flatpak GI can expose GstValueList as an unknown type.
+    # Fall back to parsing the serialized structure string.
+    try:
+        text = structure.to_string()
+    except Exception:
+        return np.empty(0, dtype=np.float32)
+
+    match = _SPECTRUM_MAG_RE.search(text)
+    if not match:
+        return np.empty(0, dtype=np.float32)
+
+    # Empty fields are skipped. The whole list converts in one call; only if
+    # some item is malformed is it redone per item, dropping just the bad ones.
+    parts = [p for p in match.group(1).split(",") if p.strip()]
+    try:
+        return np.array(parts, dtype=np.float32)
+    except ValueError:
+        pass
+    values: list[float] = []
+    for part in parts:
+        try:
+            values.append(float(part))
+        except ValueError:
+            continue
+    return np.array(values, dtype=np.float32)
+
+
+class _SpectrumWorker(QObject):
+    def __init__(self, analyzer: SpectrumAnalyzer) -> None:
+        super().__init__()
+        self._analyzer = analyzer
+
+    @Slot(object)
+    def process(self, structure: Any) -> None:
+        magnitudes = _extract_magnitudes(structure)
+        if magnitudes.size:
+            self._analyzer.update_from_magnitudes(magnitudes)
+
+
 class AudioEngine(QObject):
     position_changed = Signal(float, float)
     state_changed = Signal(str)
-    track_changed = Signal(dict)
-    queue_changed = Signal(list, int)
-    spectrum_updated = Signal(list)
+    track_changed = Signal(object)
+    queue_changed = Signal(object, int)
+    spectrum_updated = Signal(object)
     error = Signal(str)
+    _spectrum_message = Signal(object)
+    _spectrum_frame = Signal()
 
     def __init__(self) -> None:
         super().__init__()
         self._queue: list[dict] = []
         self._current_index: int = -1
         self._shuffle = False
+        self._shuffle_order: list[int] = []
+        self._shuffle_pos = 0
         self._repeat_one = False
         self._volume = 0.75
         self._state = "stopped"
+        self._duration_ns: int | None = None
+        self._duration_ticks = 0
 
         self._eq_values = [0.0] * 16
+        # equalizer-10bands has band0..band9, map 16 virtual bands down to 10.
+        self._eq_src_indices = tuple(
+            int(i * (len(self._eq_values) - 1) / 9) for i in range(len(_EQ_BAND_NAMES))
+        )
         self._bass = 0.0
         self._treble = 0.0
         self._balance = 0.0
@@ -55,7 +114,15 @@ class AudioEngine(QObject):
         }
 
         self._spectrum = SpectrumAnalyzer(128)
-        self._spectrum.spectrum_ready.connect(self.spectrum_updated.emit)
+        # Frames are handed to the GUI thread through a one-slot mailbox: only the
+        # newest frame is kept and at most one delivery is queued, so a busy GUI
+        # skips stale frames instead of working through a backlog.
+        self._spectrum_latest: np.ndarray | None = None
+        self._spectrum_pending = False
+        self._spectrum.spectrum_ready.connect(self._stash_spectrum, Qt.ConnectionType.DirectConnection)
+        self._spectrum_frame.connect(self._deliver_spectrum, Qt.ConnectionType.QueuedConnection)
+        self._spectrum_thread: QThread | None = None
+        self._spectrum_worker: _SpectrumWorker | None = None
 
         self._player = None
         self._eq = None
@@ -78,6 +145,9 @@ class AudioEngine(QObject):
             self._startup_error = f"GStreamer init failed: {exc}"
             self._is_ready = False
 
+        if self._is_ready:
+            self._start_spectrum_thread()
+
         self._poll_timer = QTimer(self)
         self._poll_timer.setInterval(100)
         self._poll_timer.timeout.connect(self._poll)
@@ -99,6 +169,43 @@ class AudioEngine(QObject):
     def is_ready(self) -> bool:
         return self._is_ready
 
+    def _start_spectrum_thread(self) -> None:
+        # Bus messages arrive on the GUI thread; parse and smooth them elsewhere so
+        # only the finished band list is delivered back (queued) to the UI.
+        self._spectrum_thread = QThread()
+        self._spectrum_thread.setObjectName("groov-spectrum")
+        self._spectrum_worker = _SpectrumWorker(self._spectrum)
+        self._spectrum_worker.moveToThread(self._spectrum_thread)
+        self._spectrum.moveToThread(self._spectrum_thread)
+        self._spectrum_message.connect(self._spectrum_worker.process)
+        self._spectrum_thread.start()
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_spectrum_thread)
+
+    def _stash_spectrum(self, values: np.ndarray) -> None:
+        # Runs on the spectrum thread. Store before checking the flag: if the GUI
+        # cleared it in between, it then reads this frame or queues another pass.
+        self._spectrum_latest = values
+        if not self._spectrum_pending:
+            self._spectrum_pending = True
+            self._spectrum_frame.emit()
+
+    @Slot()
+    def _deliver_spectrum(self) -> None:
+        self._spectrum_pending = False
+        values = self._spectrum_latest
+        if values is not None:
+            self.spectrum_updated.emit(values)
+
+    def _stop_spectrum_thread(self) -> None:
+        if self._spectrum_thread is None:
+            return
+        self._spectrum_thread.quit()
+        self._spectrum_thread.wait()
+        self._spectrum_thread = None
+
     def _build_pipeline(self) -> bool:
         assert Gst is not None
         self._player = Gst.ElementFactory.make("playbin", "player")
@@ -165,6 +272,7 @@ class AudioEngine(QObject):
             return
         self._queue = tracks
         self._current_index = -1
+        self._shuffle_order = []
         self.queue_changed.emit(self._queue, self._current_index)
         if not tracks:
             self.stop()
@@ -179,6 +287,11 @@ class AudioEngine(QObject):
         if not self._queue:
             return
         index = max(0, min(index, len(self._queue) - 1))
+        # A jump off the shuffle order (e.g. a queue row picked by hand) starts a
+        # fresh cycle from this track, so the next step can't replay it.
+        order = self._shuffle_order
+        if order and (self._shuffle_pos >= len(order) or order[self._shuffle_pos] != index):
+            self._shuffle_order = []
         self._current_index = index
         track = self._queue[index]
         self._load_and_play(track)
@@ -192,7 +305,13 @@ class AudioEngine(QObject):
         if queue is None:
             queue = [track]
         self._queue = queue
-        self._current_index = queue.index(track) if track in queue else 0
+        self._shuffle_order = []
+        # list.index short-circuits on identity, so callers passing the same
+        # object that lives in the queue resolve in a single scan.
+        try:
+            self._current_index = queue.index(track)
+        except ValueError:
+            self._current_index = 0
         self._load_and_play(self._queue[self._current_index])
         self.queue_changed.emit(self._queue, self._current_index)
 
@@ -207,6 +326,7 @@ class AudioEngine(QObject):
             uri = Path(path).resolve().as_uri()
 
         self._player.set_state(Gst.State.NULL)
+        self._duration_ns = None
         self._player.set_property("uri", uri)
         self._player.set_state(Gst.State.PLAYING)
         self._state = "playing"
@@ -274,8 +394,10 @@ class AudioEngine(QObject):
         if not self._queue:
             return
         if self._shuffle and len(self._queue) > 1:
-            choices = [i for i in range(len(self._queue)) if i != self._current_index]
-            self.play_index(random.choice(choices))
+            self._shuffle_pos += 1
+            if self._shuffle_pos >= len(self._shuffle_order):
+                self._rebuild_shuffle_order()
+            self.play_index(self._shuffle_order[self._shuffle_pos])
             return
 
         if self._current_index + 1 < len(self._queue):
@@ -313,6 +435,17 @@ class AudioEngine(QObject):
 
     def set_shuffle(self, enabled: bool) -> None:
         self._shuffle = enabled
+        self._shuffle_order = []
+
+    def _rebuild_shuffle_order(self) -> None:
+        # Fresh permutation with the current track first so it is not replayed next.
+        n = len(self._queue)
+        order = random.sample(range(n), n)
+        if 0 <= self._current_index < n:
+            order.remove(self._current_index)
+            order.insert(0, self._current_index)
+        self._shuffle_order = order
+        self._shuffle_pos = 1
 
     def set_preamp(self, value: float) -> None:
         self._preamp = max(0.0, min(2.0, value))
@@ -357,19 +490,19 @@ class AudioEngine(QObject):
         if self._eq is None:
             return
 
-        # equalizer-10bands has band0..band9, map 16 virtual bands down to 10.
-        mapped = [0.0] * 10
-        for i in range(10):
-            src_idx = int(i * (len(self._eq_values) - 1) / 9)
-            mapped[i] = self._eq_values[src_idx]
+        mapped = [self._eq_values[j] for j in self._eq_src_indices]
 
         mapped[0] += self._bass * 0.8
         mapped[1] += self._bass * 0.5
         mapped[8] += self._treble * 0.5
         mapped[9] += self._treble * 0.8
 
-        for i, gain in enumerate(mapped):
-            self._eq.set_property(f"band{i}", max(-24.0, min(24.0, gain)))
+        for name, gain in zip(_EQ_BAND_NAMES, mapped):
+            if gain > 24.0:
+                gain = 24.0
+            elif gain < -24.0:
+                gain = -24.0
+            self._eq.set_property(name, gain)
 
     def _poll(self) -> None:
         if not self._is_ready or self._player is None:
@@ -377,9 +510,14 @@ class AudioEngine(QObject):
 
         if self._state in {"playing", "paused"}:
             success_pos, pos = self._player.query_position(Gst.Format.TIME)
-            success_dur, dur = self._player.query_duration(Gst.Format.TIME)
-            if success_pos and success_dur:
-                self.position_changed.emit(pos / Gst.SECOND, max(dur / Gst.SECOND, 0.0))
+            # Duration is stable within a track; re-query it about once a second.
+            self._duration_ticks = (self._duration_ticks + 1) % 10
+            if self._duration_ns is None or self._duration_ticks == 0:
+                success_dur, dur = self._player.query_duration(Gst.Format.TIME)
+                if success_dur:
+                    self._duration_ns = dur
+            if success_pos and self._duration_ns is not None:
+                self.position_changed.emit(pos / Gst.SECOND, max(self._duration_ns / Gst.SECOND, 0.0))
 
     def _on_bus_message(self, _bus: Any, msg: Any) -> None:
         self._handle_message(msg)
@@ -402,37 +540,11 @@ class AudioEngine(QObject):
             if structure.get_name() != "spectrum":
                 return
 
-            magnitudes = self._extract_magnitudes(structure)
-            if magnitudes:
-                self._spectrum.update_from_magnitudes(magnitudes)
-
-    @staticmethod
-    def _extract_magnitudes(structure: Any) -> list[float]:
-        # Most runtimes expose "magnitude" as an iterable value.
-        try:
-            raw = structure.get_value("magnitude")
-            return [float(v) for v in raw]
-        except Exception:
-            pass
+            if self._spectrum_thread is not None:
+                # The structure belongs to the message; hand the worker its own copy.
+                self._spectrum_message.emit(structure.copy())
+                return
 
-        # GNOME/Flatpak GI can expose GstValueList as an unknown type.
-        # Fall back to parsing the serialized structure string.
-        try:
-            text = structure.to_string()
-        except Exception:
-            return []
-
-        match = _SPECTRUM_MAG_RE.search(text)
-        if not match:
-            return []
-
-        values: list[float] = []
-        for part in match.group(1).split(","):
-            p = part.strip()
-            if not p:
-                continue
-            try:
-                values.append(float(p))
-            except ValueError:
-                continue
-        return values
+            magnitudes = _extract_magnitudes(structure)
+            if magnitudes.size:
+                self._spectrum.update_from_magnitudes(magnitudes)
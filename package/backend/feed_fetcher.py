@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import hashlib
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from .json_file import read_json, write_json
+
+
+_ITUNES_NS = "{http://www.itunes.com/dtds/podcast-1.0.dtd}"
+_FETCH_TIMEOUT_S = 10
+
+
+def parse_feed(stream: BinaryIO, url: str) -> dict:
+    # Streams the document: each <item> is turned into an episode and cleared as
+    # soon as it closes, so a large feed never sits in memory as a whole tree.
+    title: str | None = None
+    seen_channel = False
+    item_count = 0
+    episodes: list[dict] = []
+    # Tags of the open elements; rss > channel > item is what matters.
+    stack: list[str] = []
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            stack.append(elem.tag)
+            continue
+        stack.pop()
+        if len(stack) == 1 and elem.tag == "channel":
+            seen_channel = True
+        elif len(stack) != 2 or stack[1] != "channel":
+            continue
+        elif elem.tag == "title" and title is None:
+            title = (elem.text or "").strip()
+        elif elem.tag == "item":
+            item_count += 1
+            enclosure = elem.find("enclosure")
+            media_url = enclosure.attrib.get("url", "") if enclosure is not None else ""
+            if media_url:
+                episodes.append(
+                    {
+                        "path": media_url,
+                        "title": elem.findtext("title", default=f"Episode {item_count}").strip(),
+                        "artist": "",
+                        "album": "Podcast",
+                        "year": "",
+                        "duration": 0.0,
+                        "cover_art_path": "",
+                        "composer": "",
+                        "episode": elem.findtext(f"{_ITUNES_NS}episode", default=str(item_count)),
+                        "duration_label": elem.findtext(f"{_ITUNES_NS}duration", default="--:--"),
+                    }
+                )
+            elem.clear()
+
+    if not seen_channel:
+        raise ValueError("Invalid RSS feed")
+    if title is None:
+        title = url
+    # The channel title may come after the items; fill it in once at the end.
+    for episode in episodes:
+        episode["artist"] = title
+    return {"title": title, "episodes": episodes}
+
+
+class FeedFetcher(QObject):
+    # (url, {"title", "episodes"}) or (url, error message); always on the GUI thread.
+    feed_loaded = Signal(str, object)
+    feed_failed = Signal(str, str)
+    # Worker-thread results, delivered to _finish_request on the GUI thread.
+    _fetch_done = Signal(str, object, str)
+
+    def __init__(self, cache_dir: Path) -> None:
+        super().__init__()
+        self._cache_dir = cache_dir
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="groov-feeds")
+        # URLs with a fetch in flight; a repeat request joins the running one.
+        self._pending: set[str] = set()
+        self._fetch_done.connect(self._finish_request)
+
+    def request(self, url: str) -> None:
+        if url in self._pending:
+            return
+        self._pending.add(url)
+        future = self._pool.submit(self._fetch, url)
+        future.add_done_callback(lambda f: self._deliver(url, f))
+
+    def _deliver(self, url: str, future) -> None:
+        try:
+            self._fetch_done.emit(url, future.result(), "")
+        except Exception as exc:
+            self._fetch_done.emit(url, None, str(exc))
+
+    @Slot(str, object, str)
+    def _finish_request(self, url: str, feed: dict | None, error: str) -> None:
+        self._pending.discard(url)
+        if feed is None:
+            self.feed_failed.emit(url, error)
+        else:
+            self.feed_loaded.emit(url, feed)
+
+    def _cache_path(self, url: str) -> Path:
+        return self._cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def _fetch(self, url: str) -> dict:
+        # A conditional GET against the validators of the last parse: an unchanged
+        # feed costs one 304 round trip and no XML parsing.
+        cache_path = self._cache_path(url)
+        try:
+            cached = read_json(cache_path)
+        except (OSError, ValueError):
+            cached = {}
+        feed = cached.get("feed") if isinstance(cached, dict) else None
+
+        request = Request(url)
+        if feed is not None:
+            if cached.get("etag"):
+                request.add_header("If-None-Match", cached["etag"])
+            if cached.get("last_modified"):
+                request.add_header("If-Modified-Since", cached["last_modified"])
+
+        try:
+            with urlopen(request, timeout=_FETCH_TIMEOUT_S) as response:
+                etag = response.headers.get("ETag", "")
+                last_modified = response.headers.get("Last-Modified", "")
+                feed = parse_feed(response, url)
+        except HTTPError as exc:
+            if exc.code == 304 and feed is not None:
+                return feed
+            raise
+
+        if etag or last_modified:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                write_json(cache_path, {"url": url, "etag": etag, "last_modified": last_modified, "feed": feed})
+            except OSError:
+                pass
+        return feed
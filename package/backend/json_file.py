@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+
+def dumps_json(payload: Any, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(payload, indent=2).encode("utf-8")
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: str | Path) -> Any:
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if not data.strip():
+        return {}
+    return loads_json(data)
+
+
+def write_json(path: str | Path, payload: Any, indent: bool = False) -> None:
+    data = dumps_json(payload, indent)
+
+    # Write beside the target and rename so a crash never leaves a truncated file.
+    target = os.fspath(path)
+    tmp = target + ".tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, target)
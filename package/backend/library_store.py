@@ -1,28 +1,50 @@
 from __future__ import annotations
 
-import json
+import bisect
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable
+from typing import Iterator
 
 from PySide6.QtCore import QObject, Signal
 
-from .metadata import AUDIO_EXTENSIONS, MetadataExtractor
+from .json_file import read_json, write_json
+from .metadata import (
+    AUDIO_EXTENSIONS,
+    FLAG_WRAPPED,
+    FLAGS_COMPLETE,
+    MetadataExtractor,
+    TrackMetadata,
+)
+
+# Bump when extractor logic changes so stored tracks get re-checked on next load.
+SCHEMA_VERSION = 3
+
+
+def _title_key(track: TrackMetadata) -> str:
+    return track.title.lower()
 
 
 class LibraryStore(QObject):
-    library_changed = Signal(list)
+    library_changed = Signal(object)
 
     def __init__(self, data_file: str | Path) -> None:
         super().__init__()
         self._path = Path(data_file)
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._extractor = MetadataExtractor()
-        self._tracks: list[dict] = []
+        self._tracks: list[TrackMetadata] = []
         self._folders: list[str] = []
+        # Artist/album/year/composer/cover repeat across whole albums; keep one copy of each.
+        self._strings: dict[str, str] = {}
+        self._write_suspended = False
+        self._dirty = False
+        self._change_pending = False
         self.load()
 
     @property
-    def tracks(self) -> list[dict]:
+    def tracks(self) -> list[TrackMetadata]:
         return list(self._tracks)
 
     @property
@@ -35,62 +57,114 @@ class LibraryStore(QObject):
             return
 
         try:
-            content = json.loads(self._path.read_text(encoding="utf-8") or "{}")
+            content = read_json(self._path)
         except Exception:
             content = {}
 
         self._folders = [str(Path(p)) for p in content.get("folders", [])]
+        known = self._build_known_set()
+        self._strings.clear()
         self._tracks = [
-            t for t in content.get("tracks", []) if Path(t.get("path", "")).exists()
+            self._share_strings(TrackMetadata.from_json(t))
+            for t in content.get("tracks", [])
+            if t.get("path", "") in known or os.path.exists(t.get("path", ""))
         ]
-        if self._refresh_incomplete_metadata():
+        if content.get("schema") != SCHEMA_VERSION:
+            self._refresh_incomplete_metadata()
             self._write()
         self._sort_tracks()
 
+    def _build_known_set(self) -> set[str]:
+        # One scandir walk per library folder instead of a stat per track;
+        # tracks outside these folders fall back to os.path.exists in load().
+        known: set[str] = set()
+        for folder in self._folders:
+            known.update(self._iter_audio_files(folder))
+        return known
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        # Nested batches share the outermost one; a single write and a single
+        # library_changed happen on exit.
+        if self._write_suspended:
+            yield
+            return
+        self._write_suspended = True
+        try:
+            yield
+        finally:
+            self._write_suspended = False
+            self.flush()
+            if self._change_pending:
+                self._change_pending = False
+                self.library_changed.emit(self.tracks)
+
+    def flush(self) -> None:
+        if self._dirty:
+            self._write()
+
+    def _publish(self) -> None:
+        self._write()
+        if self._write_suspended:
+            self._change_pending = True
+        else:
+            self.library_changed.emit(self.tracks)
+
     def _write(self) -> None:
-        payload = {"folders": self._folders, "tracks": self._tracks}
-        self._path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        if self._write_suspended:
+            self._dirty = True
+            return
+        self._dirty = False
+        payload = {
+            "schema": SCHEMA_VERSION,
+            "folders": self._folders,
+            "tracks": [t.to_json() for t in self._tracks],
+        }
+        write_json(self._path, payload, indent=True)
+
+    def _share_strings(self, track: TrackMetadata) -> TrackMetadata:
+        cache = self._strings
+        track.artist = cache.setdefault(track.artist, track.artist)
+        track.album = cache.setdefault(track.album, track.album)
+        track.year = cache.setdefault(track.year, track.year)
+        track.composer = cache.setdefault(track.composer, track.composer)
+        track.cover_art_path = cache.setdefault(track.cover_art_path, track.cover_art_path)
+        return track
 
     def _sort_tracks(self) -> None:
-        self._tracks.sort(key=lambda t: (t.get("title") or "").lower())
+        self._tracks.sort(key=_title_key)
 
     def _refresh_incomplete_metadata(self) -> bool:
         changed = False
         for idx, track in enumerate(self._tracks):
             if not self._needs_metadata_refresh(track):
                 continue
-            path = track.get("path", "")
-            if not path or not Path(path).exists():
+            if not track.path:
                 continue
-            refreshed = self._extractor.extract(path).to_json()
-            self._tracks[idx] = refreshed
+            self._tracks[idx] = self._share_strings(self._extractor.extract(track.path))
             changed = True
         return changed
 
     @staticmethod
-    def _needs_metadata_refresh(track: dict) -> bool:
-        title_raw = (track.get("title") or "").strip()
-        artist_raw = (track.get("artist") or "").strip()
-        album_raw = (track.get("album") or "").strip()
-        title = title_raw.lower()
-        artist = artist_raw.lower()
-        album = album_raw.lower()
-
-        has_wrapped = any(
-            text.startswith("[") and text.endswith("]")
-            for text in (title_raw, artist_raw, album_raw)
-        )
-        return (
-            not title
-            or artist in {"", "unknown artist"}
-            or album in {"", "unknown album"}
-            or has_wrapped
-        )
-
-    def _iter_audio_files(self, folder: Path) -> Iterable[Path]:
-        for path in folder.rglob("*"):
-            if path.is_file() and path.suffix.lower() in AUDIO_EXTENSIONS:
-                yield path
+    def _needs_metadata_refresh(track: TrackMetadata) -> bool:
+        flags = track.flags
+        return (flags & FLAGS_COMPLETE) != FLAGS_COMPLETE or bool(flags & FLAG_WRAPPED)
+
+    def _iter_audio_files(self, folder: str | Path) -> Iterator[str]:
+        stack = [os.fspath(folder)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            name = entry.name
+                            dot = name.rfind(".")
+                            if dot >= 0 and name[dot:].lower() in AUDIO_EXTENSIONS:
+                                yield entry.path
+            except OSError:
+                continue
 
     def add_folder(self, folder: str | Path) -> int:
         root = Path(folder).expanduser().resolve()
@@ -100,17 +174,19 @@ class LibraryStore(QObject):
         if str(root) not in self._folders:
             self._folders.append(str(root))
 
-        existing = {t["path"] for t in self._tracks}
-        added = 0
-        for file_path in self._iter_audio_files(root):
-            if str(file_path) in existing:
-                continue
-            self._tracks.append(self._extractor.extract(file_path).to_json())
-            added += 1
+        existing = {t.path for t in self._tracks}
+        new_files = [p for p in self._iter_audio_files(root) if p not in existing]
+        if new_files:
+            # Tag reads are I/O-bound, so a small pool overlaps the file opens.
+            workers = min(8, os.cpu_count() or 4, len(new_files))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                self._tracks.extend(
+                    map(self._share_strings, pool.map(self._extractor.extract, new_files))
+                )
+        added = len(new_files)
 
         self._sort_tracks()
-        self._write()
-        self.library_changed.emit(self.tracks)
+        self._publish()
         return added
 
     def add_file(self, audio_file: str | Path) -> bool:
@@ -122,13 +198,13 @@ class LibraryStore(QObject):
         ):
             return False
 
-        if any(t["path"] == str(path) for t in self._tracks):
+        if any(t.path == str(path) for t in self._tracks):
             return False
 
-        self._tracks.append(self._extractor.extract(path).to_json())
-        self._sort_tracks()
-        self._write()
-        self.library_changed.emit(self.tracks)
+        # The list is already sorted, so place the one new track instead of re-sorting.
+        track = self._share_strings(self._extractor.extract(path))
+        bisect.insort(self._tracks, track, key=_title_key)
+        self._publish()
         return True
 
     def remove_folder(self, folder: str | Path) -> int:
@@ -138,9 +214,9 @@ class LibraryStore(QObject):
             self._folders.remove(root_s)
 
         before = len(self._tracks)
-        kept: list[dict] = []
+        kept: list[TrackMetadata] = []
         for track in self._tracks:
-            t_path = Path(track.get("path", ""))
+            t_path = Path(track.path)
             try:
                 t_path.relative_to(root)
                 continue
@@ -149,19 +225,13 @@ class LibraryStore(QObject):
         self._tracks = kept
         removed = before - len(self._tracks)
         self._sort_tracks()
-        self._write()
-        self.library_changed.emit(self.tracks)
+        self._publish()
         return removed
 
-    def find_missing_metadata(self) -> list[dict]:
-        missing: list[dict] = []
+    def find_missing_metadata(self) -> list[TrackMetadata]:
+        return list(self.iter_missing_metadata())
+
+    def iter_missing_metadata(self) -> Iterator[TrackMetadata]:
         for track in self._tracks:
-            title = (track.get("title") or "").strip().lower()
-            artist = (track.get("artist") or "").strip().lower()
-            album = (track.get("album") or "").strip().lower()
-            if not title or artist in {"", "unknown artist"} or album in {
-                "",
-                "unknown album",
-            }:
-                missing.append(track)
-        return missing
+            if (track.flags & FLAGS_COMPLETE) != FLAGS_COMPLETE:
+                yield track
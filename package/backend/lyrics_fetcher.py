@@ -1,59 +1,122 @@
 from __future__ import annotations
 
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, Slot
 
 
 _TIMESTAMP_RE = re.compile(r"\[(\d{1,2}):(\d{2})(?:\.(\d{1,3}))?\]")
+_CACHE_SIZE = 128
+
+# (mtimes of the .lrc/.txt sidecars, entries read from them)
+_Loaded = tuple[tuple[int | None, ...], list[tuple[float, str]]]
 
 
 class LyricsFetcher(QObject):
     lyrics_changed = Signal(list)
+    # (track path, entries) for request(); may arrive after the track changed again.
+    lyrics_loaded = Signal(str, object)
+    # Worker-thread results, delivered to _finish_request on the GUI thread.
+    _read_done = Signal(str, object)
 
     def __init__(self) -> None:
         super().__init__()
         self._entries: list[tuple[float, str]] = []
+        self._cache: OrderedDict[str, _Loaded] = OrderedDict()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="groov-lyrics")
+        self._read_done.connect(self._finish_request)
 
     @property
     def entries(self) -> list[tuple[float, str]]:
         return self._entries
 
     def load_for_track(self, track_path: str) -> list[tuple[float, str]]:
-        path = Path(track_path)
-        lrc_path = path.with_suffix(".lrc")
-        txt_path = path.with_suffix(".txt")
-
-        if lrc_path.exists():
-            text = lrc_path.read_text(encoding="utf-8", errors="ignore")
-            self._entries = self._parse_lrc(text)
-        elif txt_path.exists():
-            lines = txt_path.read_text(encoding="utf-8", errors="ignore").splitlines()
-            self._entries = [(idx * 3.0, line.strip()) for idx, line in enumerate(lines) if line.strip()]
-        else:
-            self._entries = [(0.0, "No synced lyrics found")]
-
+        stamp, self._entries = self._load(track_path, self._cache.get(track_path))
+        self._remember(track_path, stamp, self._entries)
         self.lyrics_changed.emit(self._entries)
         return self._entries
 
+    def request(self, track_path: str) -> None:
+        # Like load_for_track, but the file is read on a worker thread and the
+        # result arrives through lyrics_loaded. A cached result is reused only
+        # while the sidecar mtimes match, so edited or new lyric files show up.
+        future = self._pool.submit(self._load, track_path, self._cache.get(track_path))
+        future.add_done_callback(lambda f: self._read_done.emit(track_path, f.result()))
+
+    @Slot(str, object)
+    def _finish_request(self, track_path: str, result: _Loaded) -> None:
+        stamp, entries = result
+        self._remember(track_path, stamp, entries)
+        self._entries = entries
+        self.lyrics_changed.emit(entries)
+        self.lyrics_loaded.emit(track_path, entries)
+
+    def _remember(self, track_path: str, stamp: tuple[int | None, ...], entries: list[tuple[float, str]]) -> None:
+        self._cache[track_path] = (stamp, entries)
+        self._cache.move_to_end(track_path)
+        if len(self._cache) > _CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    @classmethod
+    def _load(cls, track_path: str, cached: _Loaded | None) -> _Loaded:
+        stamp = cls._sidecar_stamp(track_path)
+        if cached is not None and cached[0] == stamp:
+            return cached
+        return stamp, cls._read(track_path)
+
+    @staticmethod
+    def _sidecar_stamp(track_path: str) -> tuple[int | None, ...]:
+        try:
+            path = Path(track_path)
+            sidecars = (path.with_suffix(".lrc"), path.with_suffix(".txt"))
+        except ValueError:
+            return ()
+        stamp: list[int | None] = []
+        for sidecar in sidecars:
+            try:
+                stamp.append(sidecar.stat().st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    @classmethod
+    def _read(cls, track_path: str) -> list[tuple[float, str]]:
+        path = Path(track_path)
+        try:
+            lrc_path = path.with_suffix(".lrc")
+            txt_path = path.with_suffix(".txt")
+            if lrc_path.exists():
+                return cls._parse_lrc(lrc_path.read_text(encoding="utf-8", errors="ignore"))
+            if txt_path.exists():
+                lines = txt_path.read_text(encoding="utf-8", errors="ignore").splitlines()
+                return [(idx * 3.0, line.strip()) for idx, line in enumerate(lines) if line.strip()]
+        except (OSError, ValueError):
+            pass
+        return [(0.0, "No synced lyrics found")]
+
     @staticmethod
     def _parse_lrc(text: str) -> list[tuple[float, str]]:
         out: list[tuple[float, str]] = []
         for line in text.splitlines():
-            matches = list(_TIMESTAMP_RE.finditer(line))
-            lyric = _TIMESTAMP_RE.sub("", line).strip()
-            if not matches:
+            # One finditer pass yields both the timestamps and the lyric text between
+            # them; a timestamp may follow a tag, as in "[offset:100][00:05]text".
+            stamps: list[float] = []
+            pieces: list[str] = []
+            pos = 0
+            for match in _TIMESTAMP_RE.finditer(line):
+                pieces.append(line[pos : match.start()])
+                pos = match.end()
+                minutes, seconds, millis_str = match.groups()
+                millis = int((millis_str or "0").ljust(3, "0")[:3])
+                stamps.append(int(minutes) * 60 + int(seconds) + (millis / 1000))
+            if not stamps:
                 continue
-            if not lyric:
-                lyric = "..."
-            for match in matches:
-                minutes = int(match.group(1))
-                seconds = int(match.group(2))
-                millis_str = match.group(3) or "0"
-                millis = int(millis_str.ljust(3, "0")[:3])
-                ts = minutes * 60 + seconds + (millis / 1000)
-                out.append((ts, lyric))
+            pieces.append(line[pos:])
+            lyric = "".join(pieces).strip() or "..."
+            out.extend((ts, lyric) for ts in stamps)
 
         out.sort(key=lambda t: t[0])
         return out or [(0.0, "No synced lyrics found")]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+import hashlib
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +18,39 @@ AUDIO_EXTENSIONS = {
     ".alac",
 }
 
+# Easy-view names first, then the native ID3 and MP4 frame ids.
+_TITLE_KEYS = ("title", "TIT2", "©nam")
+_ARTIST_KEYS = ("artist", "albumartist", "TPE1", "TPE2", "©ART", "aART")
+_ALBUM_KEYS = ("album", "TALB", "©alb")
+_YEAR_KEYS = ("date", "year", "originaldate", "TDRC", "TYER", "TDOR", "©day")
+_COMPOSER_KEYS = ("composer", "TCOM", "©wrt")
+
+# Bit-field stored per track so startup checks avoid re-inspecting the strings.
+FLAG_HAS_TITLE = 1 << 0
+FLAG_HAS_ARTIST = 1 << 1
+FLAG_HAS_ALBUM = 1 << 2
+FLAG_WRAPPED = 1 << 3
+FLAGS_COMPLETE = FLAG_HAS_TITLE | FLAG_HAS_ARTIST | FLAG_HAS_ALBUM
+
+
+def metadata_flags(title: str, artist: str, album: str) -> int:
+    title_raw = title.strip()
+    artist_raw = artist.strip()
+    album_raw = album.strip()
+    flags = 0
+    if title_raw:
+        flags |= FLAG_HAS_TITLE
+    if artist_raw.lower() not in {"", "unknown artist"}:
+        flags |= FLAG_HAS_ARTIST
+    if album_raw.lower() not in {"", "unknown album"}:
+        flags |= FLAG_HAS_ALBUM
+    if any(
+        text.startswith("[") and text.endswith("]")
+        for text in (title_raw, artist_raw, album_raw)
+    ):
+        flags |= FLAG_WRAPPED
+    return flags
+
 
 @dataclass(slots=True)
 class TrackMetadata:
@@ -28,9 +62,45 @@ class TrackMetadata:
     duration: float
     cover_art_path: str
     composer: str
+    flags: int = 0
 
     def to_json(self) -> dict[str, Any]:
-        return asdict(self)
+        return {name: getattr(self, name) for name in _TRACK_FIELDS}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> TrackMetadata:
+        title = str(data.get("title") or "")
+        artist = str(data.get("artist") or "")
+        album = str(data.get("album") or "")
+        flags = data.get("flags")
+        return cls(
+            path=str(data.get("path") or ""),
+            title=title,
+            artist=artist,
+            album=album,
+            year=str(data.get("year") or ""),
+            duration=float(data.get("duration") or 0.0),
+            cover_art_path=str(data.get("cover_art_path") or ""),
+            composer=str(data.get("composer") or ""),
+            flags=metadata_flags(title, artist, album) if flags is None else int(flags),
+        )
+
+    # Mapping-style access so UI code can keep treating tracks like the JSON dicts.
+    def keys(self) -> tuple[str, ...]:
+        return _TRACK_FIELDS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _TRACK_FIELDS:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _TRACK_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+
+_TRACK_FIELDS = tuple(f.name for f in fields(TrackMetadata))
 
 
 class MetadataExtractor:
@@ -57,42 +127,17 @@ class MetadataExtractor:
 
         if self._mutagen is not None:
             try:
-                easy = self._mutagen.File(str(file_path), easy=True)
                 raw = self._mutagen.File(str(file_path))
-
-                easy_tags = getattr(easy, "tags", None) if easy is not None else None
                 raw_tags = getattr(raw, "tags", None) if raw is not None else None
 
-                title = self._first_any(
-                    easy_tags,
-                    raw_tags,
-                    ("title", "TIT2", "©nam"),
-                    title,
-                )
-                artist = self._first_any(
-                    easy_tags,
-                    raw_tags,
-                    ("artist", "albumartist", "TPE1", "TPE2", "©ART", "aART"),
-                    artist,
-                )
-                album = self._first_any(
-                    easy_tags,
-                    raw_tags,
-                    ("album", "TALB", "©alb"),
-                    album,
-                )
-                year = self._first_any(
-                    easy_tags,
-                    raw_tags,
-                    ("date", "year", "originaldate", "TDRC", "TYER", "©day"),
-                    year,
-                )
-                composer = self._first_any(
-                    easy_tags,
-                    raw_tags,
-                    ("composer", "TCOM", "©wrt"),
-                    composer,
-                )
+                defaults = (title, artist, album, year, composer)
+                fields = self._read_tags(raw_tags, defaults)
+                if raw_tags and fields == defaults:
+                    # No native key matched; let mutagen's easy view translate them.
+                    easy = self._mutagen.File(str(file_path), easy=True)
+                    easy_tags = getattr(easy, "tags", None) if easy is not None else None
+                    fields = self._read_tags(easy_tags, defaults)
+                title, artist, album, year, composer = fields
 
                 if raw is not None and getattr(raw, "info", None) is not None:
                     duration = float(getattr(raw.info, "length", 0.0) or 0.0)
@@ -109,6 +154,7 @@ class MetadataExtractor:
             duration=duration,
             cover_art_path=cover_art_path,
             composer=composer,
+            flags=metadata_flags(title, artist, album),
         )
 
     @staticmethod
@@ -146,14 +192,21 @@ class MetadataExtractor:
             s = s[1:-1].strip()
         return s or fallback
 
-    def _first_any(self, easy_tags: Any, raw_tags: Any, keys: tuple[str, ...], fallback: str) -> str:
+    def _read_tags(self, tags: Any, defaults: tuple[str, str, str, str, str]) -> tuple[str, str, str, str, str]:
+        title, artist, album, year, composer = defaults
+        return (
+            self._first_any(tags, _TITLE_KEYS, title),
+            self._first_any(tags, _ARTIST_KEYS, artist),
+            self._first_any(tags, _ALBUM_KEYS, album),
+            self._first_any(tags, _YEAR_KEYS, year),
+            self._first_any(tags, _COMPOSER_KEYS, composer),
+        )
+
+    def _first_any(self, tags: Any, keys: tuple[str, ...], fallback: str) -> str:
+        if not tags:
+            return fallback
         for key in keys:
-            value = self._find_value(easy_tags, key)
-            text = self._as_text(value, "")
-            if text:
-                return text
-            value = self._find_value(raw_tags, key)
-            text = self._as_text(value, "")
+            text = self._as_text(self._find_value(tags, key), "")
             if text:
                 return text
         return fallback
@@ -208,8 +261,12 @@ class MetadataExtractor:
             if not image_bytes:
                 return ""
 
+            # Name covers by content so every track of an album shares one file.
+            digest = hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+            out = cache_dir / f"cover_{digest}.{mime_ext}"
+            if out.exists():
+                return str(out)
             cache_dir.mkdir(parents=True, exist_ok=True)
-            out = cache_dir / f"{file_path.stem}_cover.{mime_ext}"
             out.write_bytes(image_bytes)
             return str(out)
         except Exception:
@@ -1,19 +1,56 @@
 from __future__ import annotations
 
-import json
+import heapq
+import os
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QObject, QTimer, Signal
+
+from .json_file import dumps_json, loads_json, read_json, write_json
+
+
+# Edits are appended to a journal beside the JSON file; the full file is only
+# rewritten once this many have accumulated, or on quit.
+_COMPACT_EVERY = 100
+_WRITE_DELAY_MS = 250
 
 
 class PlaylistsStore(QObject):
-    playlists_changed = Signal(dict)
+    # Bulk refresh; mutators emit the narrower signals below instead.
+    playlists_changed = Signal(object)
+    playlist_added = Signal(str)
+    playlist_removed = Signal(str)
+    playlist_renamed = Signal(str, str)
+    playlist_tracks_changed = Signal(str)
+    favorites_changed = Signal()
+    play_counts_changed = Signal()
 
     def __init__(self, data_file: str | Path) -> None:
         super().__init__()
         self._path = Path(data_file)
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._journal_path = self._path.with_suffix(".log")
+        self._journal = open(self._journal_path, "ab")
+        # Sequence number of the last journalled edit; the JSON file records the
+        # last one it includes so a stale journal is never replayed twice.
+        self._seq = 0
+        self._pending = 0
         self._data: dict = {}
+        # Set views of the ordered path lists, for O(1) membership checks.
+        self._members: dict[str, set[str]] = {}
+        self._favorite_set: set[str] = set()
+        # Direct references into _data for the hot paths; rebound on every load.
+        self._play_counts: dict[str, int] = {}
+        self._favorites: list[str] = []
+        self._top_set: set[str] = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_WRITE_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
         self.load()
 
     @property
@@ -32,47 +69,165 @@ class PlaylistsStore(QObject):
         }
 
     def load(self) -> None:
+        # Only rewrite the file when it had to be repaired or the journal is long.
+        needs_write = False
         if not self._path.exists():
             self._data = self._default()
+            needs_write = True
+        else:
+            try:
+                self._data = read_json(self._path)
+            except Exception:
+                self._data = self._default()
+                needs_write = True
+
+        default = self._default()
+        for key, value in default.items():
+            if key not in self._data:
+                self._data[key] = value
+                needs_write = True
+        smart = self._data["smart"]
+        for key, value in default["smart"].items():
+            if key not in smart:
+                smart[key] = value
+                needs_write = True
+        self._seq = int(self._data.pop("journal_seq", 0))
+        self._index_members()
+        self._pending = self._replay_journal()
+        if needs_write or self._pending >= _COMPACT_EVERY:
             self._write()
-            return
 
+    def _replay_journal(self) -> int:
         try:
-            self._data = json.loads(self._path.read_text(encoding="utf-8") or "{}")
-        except Exception:
-            self._data = self._default()
+            with open(self._journal_path, "rb") as fh:
+                lines = fh.read().splitlines()
+        except OSError:
+            return 0
+        replayed = 0
+        for line in lines:
+            # A crash mid-append can leave a torn last line; skip anything unreadable.
+            try:
+                op = loads_json(line)
+                seq = int(op["seq"])
+                if seq <= self._seq:
+                    continue
+                self._apply(op)
+            except Exception:
+                continue
+            self._seq = seq
+            replayed += 1
+        return replayed
 
-        default = self._default()
-        for key, value in default.items():
-            self._data.setdefault(key, value)
-        self._write()
+    def _index_members(self) -> None:
+        self._play_counts = self._data["play_counts"]
+        self._favorites = self._data["smart"]["favorites"]
+        self._members = {name: set(paths) for name, paths in self._data["playlists"].items()}
+        self._favorite_set = set(self._favorites)
+        self._refresh_top_25()
+
+    def flush(self) -> None:
+        self._flush_timer.stop()
+        if self._pending:
+            self._write()
 
     def _write(self) -> None:
-        self._path.write_text(json.dumps(self._data, indent=2), encoding="utf-8")
-
-    def sync_from_library(self, tracks: list[dict]) -> None:
-        ordered = sorted(
-            tracks,
-            key=lambda t: (Path(t.get("path", "")).stat().st_mtime if Path(t.get("path", "")).exists() else 0),
-            reverse=True,
-        )
-        self._data["smart"]["recently_added"] = [t["path"] for t in ordered[:100]]
-        self._refresh_top_25()
-        self._write()
+        # Compact: the JSON file absorbs every journalled edit, then the journal is
+        # emptied. A crash in between is harmless since the seq guards the replay.
+        write_json(self._path, {**self._data, "journal_seq": self._seq})
+        self._journal.truncate(0)
+        self._pending = 0
+
+    def _commit(self, op: dict) -> None:
+        self._apply(op)
+        self._seq += 1
+        op["seq"] = self._seq
+        self._journal.write(dumps_json(op) + b"\n")
+        self._journal.flush()
+        self._pending += 1
+        if self._pending >= _COMPACT_EVERY:
+            self._flush_timer.start()
+
+    def _apply(self, op: dict) -> None:
+        kind = op["op"]
+        playlists = self._data["playlists"]
+        if kind == "play":
+            path = op["path"]
+            count = int(self._play_counts.get(path, 0)) + 1
+            self._play_counts[path] = count
+            if self._top_25_affected(path, count):
+                self._refresh_top_25()
+        elif kind == "append":
+            members = self._members[op["name"]]
+            if op["path"] not in members:
+                members.add(op["path"])
+                playlists[op["name"]].append(op["path"])
+        elif kind == "favorite":
+            path = op["path"]
+            if op["on"] and path not in self._favorite_set:
+                self._favorite_set.add(path)
+                self._favorites.append(path)
+            elif not op["on"] and path in self._favorite_set:
+                self._favorite_set.discard(path)
+                self._favorites.remove(path)
+        elif kind == "set":
+            playlists[op["name"]] = list(op["paths"])
+            self._members[op["name"]] = set(op["paths"])
+        elif kind == "create":
+            playlists[op["name"]] = []
+            self._members[op["name"]] = set()
+        elif kind == "rename":
+            playlists[op["new"]] = playlists.pop(op["old"])
+            self._members[op["new"]] = self._members.pop(op["old"])
+        elif kind == "delete":
+            del playlists[op["name"]]
+            self._members.pop(op["name"], None)
+        elif kind == "recent":
+            self._data["smart"]["recently_added"] = list(op["paths"])
+
+    def sync_from_library(self, tracks: list[dict]) -> bool:
+        # One stat per track into a float64 array; a missing file simply sorts last.
+        paths = [t.get("path", "") for t in tracks]
+        mtimes = np.fromiter((self._mtime(p) for p in paths), dtype=np.float64, count=len(paths))
+        # Stable sort on negated mtimes keeps equal timestamps in library order.
+        order = np.argsort(-mtimes, kind="stable")[:100]
+        recent = [paths[i] for i in order]
+        # Play counts are untouched here and the top 25 is kept current on load and
+        # on every play, so only the recently-added list can change.
+        if recent == self._data["smart"]["recently_added"]:
+            return False
+        self._commit({"op": "recent", "paths": recent})
         self.playlists_changed.emit(self._data)
+        return True
+
+    @staticmethod
+    def _mtime(path: str) -> float:
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return 0.0
 
     def _refresh_top_25(self) -> None:
-        play_counts = self._data.get("play_counts", {})
-        ordered = sorted(play_counts.items(), key=lambda x: x[1], reverse=True)
-        self._data["smart"]["top_25_most_played"] = [path for path, _ in ordered[:25]]
+        top = heapq.nlargest(25, self._play_counts.items(), key=lambda x: x[1])
+        self._data["smart"]["top_25_most_played"] = [path for path, _ in top]
+        self._top_set = {path for path, _ in top}
+
+    def _top_25_affected(self, path: str, count: int) -> bool:
+        # Counts only grow by one, so the ranking can only move if this path now
+        # reaches its predecessor's count or the current 25th entry's count.
+        # Ties fall back to a rebuild since their order follows insertion order.
+        top = self._data["smart"]["top_25_most_played"]
+        play_counts = self._play_counts
+        if path in self._top_set:
+            idx = top.index(path)
+            return idx > 0 and int(play_counts.get(top[idx - 1], 0)) <= count
+        return len(top) < 25 or int(play_counts.get(top[-1], 0)) <= count
 
     def create_playlist(self, name: str) -> bool:
         n = name.strip()
         if not n or n in self._data["playlists"]:
             return False
-        self._data["playlists"][n] = []
-        self._write()
-        self.playlists_changed.emit(self._data)
+        self._commit({"op": "create", "name": n})
+        self.playlist_added.emit(n)
         return True
 
     def rename_playlist(self, old_name: str, new_name: str) -> bool:
@@ -83,49 +238,39 @@ class PlaylistsStore(QObject):
             or nn in self._data["playlists"]
         ):
             return False
-        self._data["playlists"][nn] = self._data["playlists"].pop(old_name)
-        self._write()
-        self.playlists_changed.emit(self._data)
+        self._commit({"op": "rename", "old": old_name, "new": nn})
+        self.playlist_renamed.emit(old_name, nn)
         return True
 
     def delete_playlist(self, name: str) -> bool:
         if name not in self._data["playlists"]:
             return False
-        del self._data["playlists"][name]
-        self._write()
-        self.playlists_changed.emit(self._data)
+        self._commit({"op": "delete", "name": name})
+        self.playlist_removed.emit(name)
         return True
 
     def set_playlist_tracks(self, name: str, paths: list[str]) -> bool:
         if name not in self._data["playlists"]:
             return False
-        self._data["playlists"][name] = paths
-        self._write()
-        self.playlists_changed.emit(self._data)
+        if self._data["playlists"][name] == paths:
+            return True
+        self._commit({"op": "set", "name": name, "paths": paths})
+        self.playlist_tracks_changed.emit(name)
         return True
 
     def append_to_playlist(self, name: str, path: str) -> bool:
-        if name not in self._data["playlists"]:
+        if name not in self._data["playlists"] or path in self._members[name]:
             return False
-        if path in self._data["playlists"][name]:
-            return False
-        self._data["playlists"][name].append(path)
-        self._write()
-        self.playlists_changed.emit(self._data)
+        self._commit({"op": "append", "name": name, "path": path})
+        self.playlist_tracks_changed.emit(name)
         return True
 
     def increment_play_count(self, path: str) -> None:
-        play_counts = self._data.setdefault("play_counts", {})
-        play_counts[path] = int(play_counts.get(path, 0)) + 1
-        self._refresh_top_25()
-        self._write()
-        self.playlists_changed.emit(self._data)
+        self._commit({"op": "play", "path": path})
+        self.play_counts_changed.emit()
 
     def toggle_favorite(self, path: str, is_favorite: bool) -> None:
-        favorites: list[str] = self._data["smart"].setdefault("favorites", [])
-        if is_favorite and path not in favorites:
-            favorites.append(path)
-        if not is_favorite and path in favorites:
-            favorites.remove(path)
-        self._write()
-        self.playlists_changed.emit(self._data)
+        if is_favorite == (path in self._favorite_set):
+            return
+        self._commit({"op": "favorite", "path": path, "on": is_favorite})
+        self.favorites_changed.emit()
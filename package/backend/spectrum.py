@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from collections import deque
+from typing import Sequence
 
+import numpy as np
 from PySide6.QtCore import QObject, Signal
 
 
+_HISTORY_FRAMES = 3
+_LUT_SIZE = 1024
+
+
 class SpectrumAnalyzer(QObject):
-    spectrum_ready = Signal(list)
+    spectrum_ready = Signal(object)
 
     def __init__(self, bands: int = 128) -> None:
         super().__init__()
@@ -14,47 +19,58 @@ class SpectrumAnalyzer(QObject):
         self._gain = 1.9
         self._noise_floor = 0.09
         self._curve = 2.35
-        self._history: deque[list[float]] = deque(maxlen=3)
+        # ((db + 90) / 90 - noise_floor) / (1 - noise_floor) folds to db * scale + 1.
+        self._db_scale = 1.0 / (90.0 * (1.0 - self._noise_floor))
+        # Shaping is a pure function of dB that is flat outside -90..0, so tabulate
+        # it once; each frame is then a single interpolated lookup, no pow() per band.
+        self._lut_x = np.linspace(-90.0, 0.0, _LUT_SIZE)
+        self._lut = self._lut_x.copy()
+        self._shape(self._lut)
+        # Ring buffer of the last few shaped frames, averaged for smoothing via a
+        # running sum (float64 so add/subtract drift stays negligible).
+        self._history = np.zeros((_HISTORY_FRAMES, bands), dtype=np.float32)
+        self._history_sum = np.zeros(bands, dtype=np.float64)
+        self._history_pos = 0
+        self._history_len = 0
+        # Sample grids for resampling; the output grid never changes.
+        self._dst_x = np.linspace(0.0, 1.0, bands)
+        self._src_x = np.empty(0)
 
     @property
     def bands(self) -> int:
         return self._bands
 
-    def update_from_magnitudes(self, magnitudes: list[float]) -> None:
-        if not magnitudes:
-            values = [0.0] * self._bands
-        elif len(magnitudes) == self._bands:
-            values = [self._apply_gain_shape(self._db_to_norm(v)) for v in magnitudes]
+    def update_from_magnitudes(self, magnitudes: Sequence[float] | np.ndarray) -> None:
+        # Runs per frame; each attribute is looked up once.
+        pos = self._history_pos
+        history_sum = self._history_sum
+        row = self._history[pos]
+        history_sum -= row
+        if len(magnitudes) == 0:
+            row.fill(0.0)
         else:
-            values = self._resample(magnitudes, self._bands)
-
-        self._history.append(values)
-        smoothed = [sum(col) / len(col) for col in zip(*self._history)]
-        self.spectrum_ready.emit(smoothed)
-
-    @staticmethod
-    def _db_to_norm(db_val: float) -> float:
-        # Clamp typical spectrum range into [0..1]
-        if db_val <= -90.0:
-            return 0.0
-        if db_val >= 0.0:
-            return 1.0
-        return (db_val + 90.0) / 90.0
-
-    def _resample(self, values: list[float], target: int) -> list[float]:
-        if not values:
-            return [0.0] * target
-
-        out: list[float] = []
-        n = len(values)
-        for i in range(target):
-            idx = int((i / max(target - 1, 1)) * (n - 1))
-            out.append(self._apply_gain_shape(self._db_to_norm(values[idx])))
-        return out
-
-    def _apply_gain_shape(self, level: float) -> float:
-        level = max(0.0, min(1.0, level))
-        # Keep very low-level noise near zero so bars start lower.
-        level = max(0.0, (level - self._noise_floor) / (1.0 - self._noise_floor))
-        level = level ** self._curve
-        return max(0.0, min(1.0, level * self._gain))
+            if len(magnitudes) != self._bands:
+                magnitudes = self._resample(np.asarray(magnitudes, dtype=np.float32))
+            row[:] = np.interp(magnitudes, self._lut_x, self._lut)
+        history_sum += row
+
+        self._history_pos = (pos + 1) % _HISTORY_FRAMES
+        count = self._history_len = min(self._history_len + 1, _HISTORY_FRAMES)
+        # Handed out as float32, the dtype the visualizer works in, so the GUI
+        # thread never converts; each frame is a fresh array the receiver may keep.
+        self.spectrum_ready.emit((history_sum * (1.0 / count)).astype(np.float32))
+
+    def _shape(self, m: np.ndarray) -> None:
+        # Map -90..0 dB to [0..1] and drop the noise floor in one affine step, so a
+        # single clamp covers both; very low-level noise stays at zero.
+        m *= self._db_scale
+        m += 1.0
+        np.clip(m, 0.0, 1.0, out=m)
+        np.power(m, self._curve, out=m)
+        m *= self._gain
+        np.minimum(m, 1.0, out=m)
+
+    def _resample(self, values: np.ndarray) -> np.ndarray:
+        if self._src_x.size != values.size:
+            self._src_x = np.linspace(0.0, 1.0, values.size)
+        return np.interp(self._dst_x, self._src_x, values)
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-import ast
+import functools
+import importlib
+import itertools
 import random
+import re
 import subprocess
 import sys
 import os
+from collections import OrderedDict
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt, QTimer
+from PySide6.QtGui import QIcon, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -21,8 +26,7 @@ from PySide6.QtWidgets import (
     QInputDialog,
     QLabel,
     QDial,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMainWindow,
     QMessageBox,
     QPushButton,
@@ -34,44 +38,59 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+# Backends and tabs pull in GStreamer, mutagen, numpy and urllib, so they are
+# imported by MainWindow via _import_from once the splash has painted.
 try:
-    from .backend.audio_engine import AudioEngine
-    from .backend.library_store import LibraryStore
-    from .backend.lyrics_fetcher import LyricsFetcher
-    from .backend.playlists_store import PlaylistsStore
     from .menu.controls_menu import ControlsMenu
     from .menu.file_menu import FileMenu
     from .menu.tools_menu import ToolsMenu
     from .menu.view_menu import ViewMenu
     from .play_bar import PlayBar
-    from .tabs.library_tab import LibraryTab
-    from .tabs.music_explorer import MusicExplorerTab
     from .tabs.new_tab import NewTabWidget
-    from .tabs.now_playing import NowPlayingTab
-    from .tabs.playlists import PlaylistsTab
-    from .tabs.podcasts import PodcastsTab
+    from .ui_utils import PIXMAP_CACHE_KB
 except ImportError:
-    from backend.audio_engine import AudioEngine
-    from backend.library_store import LibraryStore
-    from backend.lyrics_fetcher import LyricsFetcher
-    from backend.playlists_store import PlaylistsStore
     from menu.controls_menu import ControlsMenu
     from menu.file_menu import FileMenu
     from menu.tools_menu import ToolsMenu
     from menu.view_menu import ViewMenu
     from play_bar import PlayBar
-    from tabs.library_tab import LibraryTab
-    from tabs.music_explorer import MusicExplorerTab
     from tabs.new_tab import NewTabWidget
-    from tabs.now_playing import NowPlayingTab
-    from tabs.playlists import PlaylistsTab
-    from tabs.podcasts import PodcastsTab
+    from ui_utils import PIXMAP_CACHE_KB
+
+if TYPE_CHECKING:
+    from .backend.feed_fetcher import FeedFetcher
+    from .tabs.music_explorer import MusicExplorerTab
+    from .tabs.now_playing import NowPlayingTab
+    from .tabs.playlists import PlaylistsTab
+    from .tabs.podcasts import PodcastsTab
+
+
+def _import_from(module: str, name: str):
+    # Same package-or-script fallback as the imports above.
+    if __package__:
+        module = f"{__package__}.{module}"
+    return getattr(importlib.import_module(module), name)
+
+
+_CLOSEABLE_TABS = frozenset({"Podcasts", "New Tab"})
+
+# Slider drags step once per pixel; DSP changes are applied at most once a frame.
+_DSP_FLUSH_MS = 16
+
+# Queue rows repeat the same album art, so decoded covers are kept per path.
+_COVER_ICON_CACHE_SIZE = 256
+
+
+def _path_stem(path: str) -> str:
+    # Path(path).stem without building a Path; used for every untitled row.
+    return os.path.splitext(os.path.basename(path))[0]
 
 
 def _resource_path(*parts: str) -> Path:
     return Path(__file__).resolve().parent.joinpath(*parts)
 
 
+@functools.lru_cache(maxsize=1)
 def _app_icon() -> QIcon:
     icon_path = _resource_path("..", "assets", "icons", "groov.svg")
     if icon_path.exists():
@@ -83,6 +102,7 @@ def _app_icon() -> QIcon:
     return QIcon()
 
 
+@functools.lru_cache(maxsize=1)
 def _data_dir() -> Path:
     override = os.environ.get("GROOV_DATA_HOME")
     if override:
@@ -101,8 +121,90 @@ def _data_dir() -> Path:
     return user_data_dir
 
 
+@functools.lru_cache(maxsize=1)
+def _cache_dir() -> Path:
+    override = os.environ.get("GROOV_DATA_HOME")
+    if override:
+        return Path(override).expanduser() / "cache"
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "Groov"
+
+
+class QueueModel(QAbstractListModel):
+    # Rows are rendered from the track dicts on demand, so only visible rows
+    # cost anything and covers are decoded once per path.
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._tracks: list[dict] = []
+        self._sig: list[tuple] = []
+        self._icons: OrderedDict[str, QIcon] = OrderedDict()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._tracks)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
+        row = index.row()
+        if not index.isValid() or row >= len(self._tracks):
+            return None
+        track = self._tracks[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            path = str(track.get("path") or "")
+            title = str(track.get("title") or (_path_stem(path) if path else "Unknown Title"))
+            artist = str(track.get("artist") or "Unknown Artist")
+            return f"{title}\n{artist}"
+        if role == Qt.ItemDataRole.DecorationRole:
+            cover = str(track.get("cover_art_path") or "")
+            if cover:
+                icon = self._cover_icon(cover)
+                if not icon.isNull():
+                    return icon
+            return None
+        return None
+
+    def set_tracks(self, tracks: list[dict]) -> None:
+        new_sig = [
+            (t.get("path"), t.get("title"), t.get("artist"), t.get("cover_art_path"))
+            for t in tracks
+        ]
+        old_sig = self._sig
+        if new_sig == old_sig:
+            self._tracks = tracks
+            return
+
+        # Only rows past the common prefix change; report just those so the
+        # view keeps its scroll position and current row.
+        common = 0
+        for common, (old, new) in enumerate(zip(old_sig, new_sig)):
+            if old != new:
+                break
+        else:
+            common = min(len(old_sig), len(new_sig))
+
+        if len(old_sig) > common:
+            self.beginRemoveRows(QModelIndex(), common, len(old_sig) - 1)
+            self._tracks = self._tracks[:common]
+            self.endRemoveRows()
+        if len(new_sig) > common:
+            self.beginInsertRows(QModelIndex(), common, len(new_sig) - 1)
+            self._tracks = tracks
+            self.endInsertRows()
+        self._tracks = tracks
+        self._sig = new_sig
+
+    def _cover_icon(self, path: str) -> QIcon:
+        cache = self._icons
+        icon = cache.get(path)
+        if icon is not None:
+            cache.move_to_end(path)
+            return icon
+        icon = QIcon(QPixmap(path)) if os.path.exists(path) else QIcon()
+        cache[path] = icon
+        if len(cache) > _COVER_ICON_CACHE_SIZE:
+            cache.popitem(last=False)
+        return icon
+
+
 class StartupSplash(QDialog):
-    def __init__(self) -> None:
+    def __init__(self, app_icon: QIcon | None = None) -> None:
         super().__init__()
         self.setWindowFlags(
             Qt.WindowType.SplashScreen
@@ -128,8 +230,7 @@ class StartupSplash(QDialog):
 
         icon = QLabel()
         icon.setFixedSize(56, 56)
-        icon_path = _resource_path("..", "assets", "icons", "groov.svg")
-        pix = QIcon(str(icon_path)).pixmap(56, 56)
+        pix = (app_icon if app_icon is not None else _app_icon()).pixmap(56, 56)
         if not pix.isNull():
             icon.setPixmap(pix)
         root.addWidget(icon, alignment=Qt.AlignmentFlag.AlignTop)
@@ -167,14 +268,29 @@ class MainWindow(QMainWindow):
         self.resize(1400, 860)
         self.setWindowIcon(_app_icon())
 
+        AudioEngine = _import_from("backend.audio_engine", "AudioEngine")
+        LibraryStore = _import_from("backend.library_store", "LibraryStore")
+        LyricsFetcher = _import_from("backend.lyrics_fetcher", "LyricsFetcher")
+        PlaylistsStore = _import_from("backend.playlists_store", "PlaylistsStore")
+
         data_dir = _data_dir()
         self.library_store = LibraryStore(data_dir / "library.json")
         self.playlists_store = PlaylistsStore(data_dir / "playlists.json")
         self.lyrics_fetcher = LyricsFetcher()
         self.audio_engine = AudioEngine()
         self.dynamic_effects_window: QDialog | None = None
+        # Created with the Podcasts tab.
+        self.feed_fetcher: FeedFetcher | None = None
 
         self.current_track: dict | None = None
+        self._current_lyrics: list[tuple[float, str]] = []
+        self._last_position_key: tuple[int, float] | None = None
+        self._np_spectrum_connected = False
+        # Library tracks by path; dropped whenever the library changes.
+        self._path_index: dict[str, dict] | None = None
+        # The tracks last pushed to the tabs. The store replaces track objects rather
+        # than editing them, so comparing lists is mostly an identity check.
+        self._library_snapshot: list[dict] | None = None
 
         self._build_ui()
         self._build_menus()
@@ -193,23 +309,28 @@ class MainWindow(QMainWindow):
         self.tabs.setTabsClosable(True)
         self.tabs.tabCloseRequested.connect(self._close_tab_request)
 
-        self.library_tab = LibraryTab()
-        self.music_explorer_tab = MusicExplorerTab()
-        self.now_playing_tab = NowPlayingTab()
-        self.playlists_tab = PlaylistsTab()
-        self.podcasts_tab = PodcastsTab()
-        self.new_tab = NewTabWidget()
-
-        self._tab_order: list[tuple[str, QWidget]] = [
-            ("Library", self.library_tab),
-            ("Music Explorer", self.music_explorer_tab),
-            ("Now Playing", self.now_playing_tab),
-            ("Playlists", self.playlists_tab),
-            ("Podcasts", self.podcasts_tab),
-            ("New Tab", self.new_tab),
+        # Only the default Library tab is built up front; the others start as empty
+        # placeholders and are built by their factory the first time they are shown.
+        self.library_tab = _import_from("tabs.library_tab", "LibraryTab")()
+        self.music_explorer_tab: MusicExplorerTab | None = None
+        self.now_playing_tab: NowPlayingTab | None = None
+        self.playlists_tab: PlaylistsTab | None = None
+        self.podcasts_tab: PodcastsTab | None = None
+        self.new_tab: NewTabWidget | None = None
+
+        # (name, factory, widget): the factory is None once widget is the real tab.
+        self._tab_order: list[tuple[str, Callable[[], QWidget] | None, QWidget]] = [
+            ("Library", None, self.library_tab),
+            ("Music Explorer", self._make_music_explorer_tab, QWidget()),
+            ("Now Playing", self._make_now_playing_tab, QWidget()),
+            ("Playlists", self._make_playlists_tab, QWidget()),
+            ("Podcasts", self._make_podcasts_tab, QWidget()),
+            ("New Tab", self._make_new_tab, QWidget()),
         ]
-        self._tab_visible = {name: True for name, _ in self._tab_order}
+        self._tab_index_by_name: dict[str, int] = {}
+        self._tab_visible = dict.fromkeys((name for name, _, _ in self._tab_order), True)
         self._tab_visible["New Tab"] = False
+        self.tabs.currentChanged.connect(self._materialize_tab)
         self._rebuild_tabs()
 
         self.new_tab_button = QPushButton("+")
@@ -218,8 +339,13 @@ class MainWindow(QMainWindow):
         self.new_tab_button.clicked.connect(self._open_new_tab)
         self.tabs.setCornerWidget(self.new_tab_button, Qt.Corner.TopRightCorner)
 
-        self.queue_list = QListWidget()
-        self.queue_list.itemDoubleClicked.connect(self._queue_item_double_clicked)
+        self.queue_model = QueueModel(self)
+        self.queue_list = QListView()
+        self.queue_list.setModel(self.queue_model)
+        # Every row is two lines of text plus a small icon, so skip per-row sizing.
+        self.queue_list.setUniformItemSizes(True)
+        # Double-click or Enter; the row is the queue index.
+        self.queue_list.activated.connect(lambda index: self.audio_engine.play_index(index.row()))
         self.queue_prev = QPushButton("Previous")
         self.queue_next = QPushButton("Next")
         self.queue_prev.clicked.connect(self.audio_engine.previous_track)
@@ -246,15 +372,68 @@ class MainWindow(QMainWindow):
         root_layout.addWidget(self.play_bar)
         self.setCentralWidget(root)
 
-        # Hide close buttons for non-closeable tabs.
-        for idx in range(self.tabs.count()):
-            text = self.tabs.tabText(idx)
-            if text not in {"Podcasts", "New Tab"}:
-                self.tabs.tabBar().setTabButton(idx, self.tabs.tabBar().ButtonPosition.RightSide, None)
-
         self._build_dsp_sidebar()
 
+    def _make_music_explorer_tab(self) -> QWidget:
+        self.music_explorer_tab = _import_from("tabs.music_explorer", "MusicExplorerTab")()
+        self.music_explorer_tab.album_play_requested.connect(self._play_album)
+        self.music_explorer_tab.set_tracks(self.library_store.tracks, self.playlists_store.data.get("play_counts", {}))
+        return self.music_explorer_tab
+
+    def _make_now_playing_tab(self) -> QWidget:
+        tab = self.now_playing_tab = _import_from("tabs.now_playing", "NowPlayingTab")()
+        tab.sample_rate.valueChanged.connect(self._on_sample_rate_changed)
+        tab.visualizer.setVisible(self.view_menu.toggle_spectrum.isChecked())
+        self.view_menu.toggle_spectrum.toggled.connect(tab.visualizer.setVisible)
+        if self.current_track is not None:
+            tab.set_track(self.current_track)
+            tab.set_lyrics(self._current_lyrics)
+        return tab
+
+    def _make_playlists_tab(self) -> QWidget:
+        tab = self.playlists_tab = _import_from("tabs.playlists", "PlaylistsTab")()
+        tab.playlist_play_requested.connect(self._play_playlist_paths)
+        tab.playlist_rename_requested.connect(self.playlists_store.rename_playlist)
+        tab.playlist_delete_requested.connect(self.playlists_store.delete_playlist)
+        tab.playlist_add_file_requested.connect(self._add_file_to_playlist)
+
+        store = self.playlists_store
+        store.playlists_changed.connect(tab.set_data)
+        store.playlist_added.connect(tab.add_playlist_name)
+        store.playlist_removed.connect(tab.remove_playlist_name)
+        store.playlist_renamed.connect(tab.rename_playlist_name)
+        store.playlist_tracks_changed.connect(tab.refresh_playlist)
+        store.favorites_changed.connect(lambda: tab.refresh_smart("favorites"))
+        store.play_counts_changed.connect(tab.refresh_play_counts)
+
+        tab.set_library_tracks(self.library_store.tracks)
+        tab.set_data(store.data)
+        return tab
+
+    def _make_podcasts_tab(self) -> QWidget:
+        self.podcasts_tab = _import_from("tabs.podcasts", "PodcastsTab")()
+        self.podcasts_tab.episode_play_requested.connect(
+            lambda track, queue: self.audio_engine.play_track(track, queue)
+        )
+        FeedFetcher = _import_from("backend.feed_fetcher", "FeedFetcher")
+        self.feed_fetcher = FeedFetcher(_cache_dir() / "feeds")
+        self.podcasts_tab.feed_requested.connect(self.feed_fetcher.request)
+        self.feed_fetcher.feed_loaded.connect(self.podcasts_tab.add_feed)
+        self.feed_fetcher.feed_failed.connect(self.podcasts_tab.show_feed_error)
+        return self.podcasts_tab
+
+    def _make_new_tab(self) -> QWidget:
+        self.new_tab = NewTabWidget()
+        self.new_tab.podcasts_requested.connect(self._activate_podcasts_from_new_tab)
+        return self.new_tab
+
     def _build_dsp_sidebar(self) -> None:
+        self._pending_dsp: dict[object, tuple[Callable[..., None], tuple]] = {}
+        self._dsp_timer = QTimer(self)
+        self._dsp_timer.setSingleShot(True)
+        self._dsp_timer.setInterval(_DSP_FLUSH_MS)
+        self._dsp_timer.timeout.connect(self._flush_dsp)
+
         self.dsp_dock = QDockWidget("DSP Effects", self)
         self.dsp_dock.setAllowedAreas(Qt.DockWidgetArea.LeftDockWidgetArea)
         self.dsp_dock.setFeatures(
@@ -288,9 +467,8 @@ class MainWindow(QMainWindow):
             slider.setValue(0)
             slider.setTickInterval(6)
             slider.setFixedHeight(140)
-            slider.valueChanged.connect(
-                lambda v, idx=i: self.audio_engine.set_equalizer_band(idx, float(v))
-            )
+            slider.valueChanged.connect(functools.partial(self._on_eq_slider, i))
+            slider.sliderReleased.connect(self._flush_dsp)
             band_layout.addWidget(slider, alignment=Qt.AlignmentFlag.AlignHCenter)
 
             band_label = QLabel(str(i + 1))
@@ -341,12 +519,7 @@ class MainWindow(QMainWindow):
             dial.setValue(value)
             value_label = QLabel(f"{value}%")
             value_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-            dial.valueChanged.connect(
-                lambda v, k=key, out=value_label: (
-                    out.setText(f"{v}%"),
-                    self.audio_engine.set_dynamic_effect(k, v / 100.0),
-                )
-            )
+            dial.valueChanged.connect(functools.partial(self._on_dynamic_dial, key, value_label))
             group_layout.addWidget(dial)
             group_layout.addWidget(value_label)
             grid.addWidget(group, 0, col)
@@ -357,6 +530,10 @@ class MainWindow(QMainWindow):
         layout.addWidget(close_btn, alignment=Qt.AlignmentFlag.AlignRight)
         return dialog
 
+    def _on_dynamic_dial(self, key: str, value_label: QLabel, value: int) -> None:
+        value_label.setText(f"{value}%")
+        self.audio_engine.set_dynamic_effect(key, value / 100.0)
+
     def _show_dynamic_effects(self) -> None:
         if self.dynamic_effects_window is None:
             self.dynamic_effects_window = self._build_dynamic_effects_window()
@@ -369,10 +546,26 @@ class MainWindow(QMainWindow):
         slider = QSlider(Qt.Orientation.Horizontal)
         slider.setRange(low, high)
         slider.setValue(val)
-        slider.valueChanged.connect(on_change)
+        slider.valueChanged.connect(functools.partial(self._queue_dsp, label, on_change))
+        slider.sliderReleased.connect(self._flush_dsp)
         layout.addWidget(slider)
         return slider
 
+    def _on_eq_slider(self, idx: int, value: int) -> None:
+        self._queue_dsp(("eq", idx), self.audio_engine.set_equalizer_band, idx, float(value))
+
+    def _queue_dsp(self, key: object, apply: Callable[..., None], *args) -> None:
+        # Keep only the latest change per control and let the timer apply it.
+        self._pending_dsp[key] = (apply, args)
+        if not self._dsp_timer.isActive():
+            self._dsp_timer.start()
+
+    def _flush_dsp(self) -> None:
+        self._dsp_timer.stop()
+        pending, self._pending_dsp = self._pending_dsp, {}
+        for apply, args in pending.values():
+            apply(*args)
+
     def _build_menus(self) -> None:
         menu_bar = self.menuBar()
         self.file_menu = FileMenu(menu_bar)
@@ -387,42 +580,33 @@ class MainWindow(QMainWindow):
         self.audio_engine.state_changed.connect(self._on_state_changed)
         self.audio_engine.queue_changed.connect(self._on_queue_changed)
         self.audio_engine.spectrum_updated.connect(self.play_bar.update_spectrum)
-        self.audio_engine.spectrum_updated.connect(self.now_playing_tab.set_spectrum)
+        self.lyrics_fetcher.lyrics_loaded.connect(self._apply_lyrics)
         self.audio_engine.error.connect(lambda m: QMessageBox.warning(self, "Audio", m))
 
         self.library_tab.track_double_clicked.connect(self._play_from_library)
-        self.music_explorer_tab.album_play_requested.connect(self._play_album)
-        self.playlists_tab.playlist_play_requested.connect(self._play_playlist_paths)
-        self.playlists_tab.playlist_rename_requested.connect(self.playlists_store.rename_playlist)
-        self.playlists_tab.playlist_delete_requested.connect(self.playlists_store.delete_playlist)
-        self.playlists_tab.playlist_add_file_requested.connect(self._add_file_to_playlist)
-        self.podcasts_tab.episode_play_requested.connect(
-            lambda track, queue: self.audio_engine.play_track(track, queue)
-        )
-        self.new_tab.podcasts_requested.connect(self._activate_podcasts_from_new_tab)
 
         self.play_bar.play_pause_clicked.connect(self.audio_engine.toggle_play_pause)
         self.play_bar.previous_clicked.connect(self.audio_engine.previous_track)
         self.play_bar.next_clicked.connect(self.audio_engine.next_track)
         self.play_bar.seek_requested.connect(self.audio_engine.seek)
         self.play_bar.volume_changed.connect(self.audio_engine.set_volume)
-        self.now_playing_tab.sample_rate.valueChanged.connect(self._on_sample_rate_changed)
 
         self.file_menu.add_folder.triggered.connect(self._add_folder)
         self.file_menu.add_file.triggered.connect(self._add_file)
         self.file_menu.remove_folder.triggered.connect(self._remove_folder)
         self.file_menu.stream_url.triggered.connect(self._stream_url)
-        self.file_menu.add_playlist.triggered.connect(self._add_playlist)
-        self.file_menu.recently_added.triggered.connect(lambda: self._open_smart_playlist("Recently Added"))
-        self.file_menu.top_25.triggered.connect(lambda: self._open_smart_playlist("Top 25 Most Played"))
-        self.file_menu.favorites.triggered.connect(lambda: self._open_smart_playlist("Favorites"))
+        self.file_menu.playlist_handlers.update(
+            add_playlist=self._add_playlist,
+            recently_added=lambda: self._open_smart_playlist("Recently Added"),
+            top_25=lambda: self._open_smart_playlist("Top 25 Most Played"),
+            favorites=lambda: self._open_smart_playlist("Favorites"),
+        )
 
         self.view_menu.toggle_library.toggled.connect(lambda v: self._set_tab_visibility("Library", v))
         self.view_menu.toggle_explorer.toggled.connect(lambda v: self._set_tab_visibility("Music Explorer", v))
         self.view_menu.toggle_now_playing.toggled.connect(lambda v: self._set_tab_visibility("Now Playing", v))
         self.view_menu.toggle_playlists.toggled.connect(lambda v: self._set_tab_visibility("Playlists", v))
         self.view_menu.toggle_podcasts.toggled.connect(lambda v: self._set_tab_visibility("Podcasts", v))
-        self.view_menu.toggle_spectrum.toggled.connect(self.now_playing_tab.visualizer.setVisible)
 
         self.controls_menu.dsp_effects.triggered.connect(self.dsp_dock.show)
         self.controls_menu.dynamic_effects.triggered.connect(self._show_dynamic_effects)
@@ -432,9 +616,10 @@ class MainWindow(QMainWindow):
         self.controls_menu.play_pause.triggered.connect(self.audio_engine.toggle_play_pause)
         self.controls_menu.next_track.triggered.connect(self.audio_engine.next_track)
 
-        self.tools_menu.show_missing_metadata.triggered.connect(self._show_missing_metadata)
+        self.tools_menu.show_missing_metadata_handler = self._show_missing_metadata
 
-        self.playlists_store.playlists_changed.connect(self.playlists_tab.set_data)
+        self.tabs.currentChanged.connect(self._retune_spectrum)
+        self.view_menu.toggle_spectrum.toggled.connect(self._retune_spectrum)
 
     def _show_audio_startup_error_if_any(self) -> None:
         if self.audio_engine.startup_error:
@@ -444,24 +629,86 @@ class MainWindow(QMainWindow):
         # Map UI slider range (8..48) to a slightly slower visual update rate (8..45 Hz).
         hz = max(8, min(45, int((value_khz / 48.0) * 45)))
         self.audio_engine.set_spectrum_update_rate(hz)
-        self.now_playing_tab.set_visualizer_fps(hz)
+        if self.now_playing_tab is not None:
+            self.now_playing_tab.set_visualizer_fps(hz)
 
     def _rebuild_tabs(self) -> None:
-        current_name = self.tabs.tabText(self.tabs.currentIndex()) if self.tabs.count() else "Library"
-        self.tabs.clear()
-        for name, widget in self._tab_order:
-            if self._tab_visible.get(name, True):
-                self.tabs.addTab(widget, name)
-
-        for idx in range(self.tabs.count()):
-            text = self.tabs.tabText(idx)
-            if text not in {"Podcasts", "New Tab"}:
-                self.tabs.tabBar().setTabButton(idx, self.tabs.tabBar().ButtonPosition.RightSide, None)
-
-        for idx in range(self.tabs.count()):
-            if self.tabs.tabText(idx) == current_name:
-                self.tabs.setCurrentIndex(idx)
+        tabs = self.tabs
+        visible = self._tab_visible
+        desired = [(name, widget) for name, _, widget in self._tab_order if visible[name]]
+        wanted = {id(widget) for _, widget in desired}
+        previous = tabs.currentWidget()
+
+        # Tabs keep a fixed relative order, so one walk removes hidden tabs and
+        # inserts newly shown ones; tabs that stay are left in place. Signals are
+        # held back so intermediate current tabs aren't built needlessly.
+        tabs.setUpdatesEnabled(False)
+        tabs.blockSignals(True)
+        try:
+            idx = 0
+            for name, widget in desired:
+                while idx < tabs.count() and id(tabs.widget(idx)) not in wanted:
+                    tabs.removeTab(idx)
+                if tabs.widget(idx) is not widget:
+                    tabs.insertTab(idx, widget, name)
+                    self._hide_close_button(idx, name)
+                idx += 1
+            while tabs.count() > idx:
+                tabs.removeTab(idx)
+            self._tab_index_by_name = {name: i for i, (name, _) in enumerate(desired)}
+            if previous is not None and tabs.indexOf(previous) >= 0:
+                tabs.setCurrentWidget(previous)
+        finally:
+            tabs.blockSignals(False)
+            tabs.setUpdatesEnabled(True)
+        if tabs.currentWidget() is not previous:
+            tabs.currentChanged.emit(tabs.currentIndex())
+
+    def _hide_close_button(self, idx: int, name: str) -> None:
+        if name not in _CLOSEABLE_TABS:
+            tab_bar = self.tabs.tabBar()
+            tab_bar.setTabButton(idx, tab_bar.ButtonPosition.RightSide, None)
+
+    def _materialize_tab(self, idx: int) -> None:
+        if idx < 0:
+            return
+        name = self.tabs.tabText(idx)
+        for pos, (entry_name, factory, placeholder) in enumerate(self._tab_order):
+            if entry_name == name:
                 break
+        else:
+            return
+        if factory is None:
+            return
+
+        widget = factory()
+        self._tab_order[pos] = (name, None, widget)
+        # Swap quietly so removing the placeholder doesn't build whichever tab
+        # becomes current in the meantime.
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(idx)
+        self.tabs.insertTab(idx, widget, name)
+        self._hide_close_button(idx, name)
+        self.tabs.setCurrentIndex(idx)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        self._retune_spectrum()
+
+    def _retune_spectrum(self, *_args) -> None:
+        # Only feed the Now Playing visualizer while it can actually be seen.
+        tab = self.now_playing_tab
+        wanted = (
+            tab is not None
+            and self.tabs.currentWidget() is tab
+            and self.view_menu.toggle_spectrum.isChecked()
+        )
+        if wanted == self._np_spectrum_connected:
+            return
+        if wanted:
+            self.audio_engine.spectrum_updated.connect(tab.set_spectrum)
+        else:
+            self.audio_engine.spectrum_updated.disconnect(tab.set_spectrum)
+        self._np_spectrum_connected = wanted
 
     def _set_tab_visibility(self, name: str, visible: bool) -> None:
         self._tab_visible[name] = visible
@@ -480,11 +727,19 @@ class MainWindow(QMainWindow):
             return
 
     def _sync_library(self, tracks: list[dict]) -> None:
+        if tracks == self._library_snapshot:
+            return
+        self._library_snapshot = tracks
+        self._path_index = None
         self.library_tab.set_tracks(tracks)
-        self.playlists_tab.set_library_tracks(tracks)
-        self.music_explorer_tab.set_tracks(tracks, self.playlists_store.data.get("play_counts", {}))
-        self.playlists_store.sync_from_library(tracks)
-        self.playlists_tab.set_data(self.playlists_store.data)
+        if self.music_explorer_tab is not None:
+            self.music_explorer_tab.set_tracks(tracks, self.playlists_store.data.get("play_counts", {}))
+        if self.playlists_tab is not None:
+            self.playlists_tab.set_library_tracks(tracks)
+        # A changed recently-added list reaches the tab through playlists_changed;
+        # otherwise it still has to redraw its rows from the new track data.
+        if not self.playlists_store.sync_from_library(tracks) and self.playlists_tab is not None:
+            self.playlists_tab.set_data(self.playlists_store.data)
 
     def _play_from_library(self, track: dict) -> None:
         queue = self.library_store.tracks
@@ -497,7 +752,7 @@ class MainWindow(QMainWindow):
         self.audio_engine.set_queue(queue, 0)
 
     def _play_playlist_paths(self, paths: list[str], shuffle: bool) -> None:
-        tracks_by_path = {t.get("path", ""): t for t in self.library_store.tracks}
+        tracks_by_path = self._get_path_index()
         queue = [tracks_by_path[p] for p in paths if p in tracks_by_path]
         if not queue:
             return
@@ -506,15 +761,15 @@ class MainWindow(QMainWindow):
         self.audio_engine.set_queue(queue, 0)
         self._select_tab("Now Playing")
 
-    def _queue_item_double_clicked(self, item: QListWidgetItem) -> None:
-        idx = item.data(Qt.ItemDataRole.UserRole)
-        if isinstance(idx, int):
-            self.audio_engine.play_index(idx)
+    def _get_path_index(self) -> dict[str, dict]:
+        if self._path_index is None:
+            self._path_index = {t.get("path", ""): t for t in self.library_store.tracks}
+        return self._path_index
 
     def _on_track_changed(self, track: dict) -> None:
         path = str(track.get("path") or "")
         display_track = dict(track)
-        display_track["title"] = str(track.get("title") or (Path(path).stem if path else "Unknown Title"))
+        display_track["title"] = str(track.get("title") or (_path_stem(path) if path else "Unknown Title"))
         display_track["artist"] = str(track.get("artist") or "Unknown Artist")
         display_track["album"] = str(track.get("album") or "Unknown Album")
         display_track["year"] = str(track.get("year") or "")
@@ -524,37 +779,44 @@ class MainWindow(QMainWindow):
         self.play_bar.set_track_info(
             display_track["title"], display_track["artist"], display_track["cover_art_path"]
         )
-        self.now_playing_tab.set_track(display_track)
-        lyrics = self.lyrics_fetcher.load_for_track(track.get("path", ""))
-        self.now_playing_tab.set_lyrics(lyrics)
+        # Lyrics are read off the GUI thread and applied in _apply_lyrics.
+        self._current_lyrics = []
+        if self.now_playing_tab is not None:
+            self.now_playing_tab.set_track(display_track)
+            self.now_playing_tab.set_lyrics(self._current_lyrics)
+        self.lyrics_fetcher.request(path)
 
         if path and not path.startswith(("http://", "https://")):
             self.playlists_store.increment_play_count(path)
-            self.music_explorer_tab.set_tracks(self.library_store.tracks, self.playlists_store.data.get("play_counts", {}))
+            if self.music_explorer_tab is not None:
+                self.music_explorer_tab.bump_play_count(path, self.playlists_store.data["play_counts"].get(path, 0))
+
+    def _apply_lyrics(self, path: str, lyrics: list[tuple[float, str]]) -> None:
+        # Drop results for a track that is no longer playing.
+        if self.current_track is None or path != str(self.current_track.get("path") or ""):
+            return
+        self._current_lyrics = lyrics
+        if self.now_playing_tab is not None:
+            self.now_playing_tab.set_lyrics(lyrics)
 
     def _on_position_changed(self, position: float, duration: float) -> None:
-        self.play_bar.set_position(position, duration)
-        self.now_playing_tab.set_position(position)
+        # The play bar shows whole seconds, so it only repaints when those change.
+        key = (int(position), duration)
+        if key != self._last_position_key or position >= duration - 0.25:
+            self._last_position_key = key
+            self.play_bar.set_position(position, duration)
+        # Lyrics need every tick to stay in sync, but only while they are on screen.
+        tab = self.now_playing_tab
+        if tab is not None and self.tabs.currentWidget() is tab:
+            tab.set_position(position)
 
     def _on_state_changed(self, state: str) -> None:
         self.play_bar.set_playing(state == "playing")
 
     def _on_queue_changed(self, queue: list[dict], current_index: int) -> None:
-        self.queue_list.clear()
-        for idx, track in enumerate(queue):
-            path = str(track.get("path") or "")
-            title = str(track.get("title") or (Path(path).stem if path else "Unknown Title"))
-            artist = str(track.get("artist") or "Unknown Artist")
-            label = f"{title}\n{artist}"
-            item = QListWidgetItem(label)
-            item.setData(Qt.ItemDataRole.UserRole, idx)
-            cover = str(track.get("cover_art_path") or "")
-            if cover and Path(cover).exists():
-                item.setIcon(QIcon(QPixmap(cover)))
-            self.queue_list.addItem(item)
-
-        if 0 <= current_index < self.queue_list.count():
-            self.queue_list.setCurrentRow(current_index)
+        self.queue_model.set_tracks(queue)
+        if 0 <= current_index < self.queue_model.rowCount():
+            self.queue_list.setCurrentIndex(self.queue_model.index(current_index))
 
     def _add_folder(self) -> None:
         folder = QFileDialog.getExistingDirectory(self, "Add Folder")
@@ -563,16 +825,21 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Library", f"Added {added} tracks.")
 
     def _add_file(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(
+        paths, _ = QFileDialog.getOpenFileNames(
             self,
-            "Add Audio File",
+            "Add Audio Files",
             "",
             "Audio Files (*.mp3 *.flac *.wav *.ogg *.m4a *.aac *.wma *.opus *.aiff *.alac)",
         )
-        if path:
-            success = self.library_store.add_file(path)
-            if not success:
-                QMessageBox.information(self, "Library", "File could not be added.")
+        if not paths:
+            return
+        # One library write and one UI sync for the whole selection.
+        with self.library_store.batch():
+            added = sum(self.library_store.add_file(path) for path in paths)
+        if len(paths) == 1 and not added:
+            QMessageBox.information(self, "Library", "File could not be added.")
+        elif added < len(paths):
+            QMessageBox.information(self, "Library", f"Added {added} of {len(paths)} files.")
 
     def _remove_folder(self) -> None:
         folder = QFileDialog.getExistingDirectory(self, "Remove Folder")
@@ -612,21 +879,24 @@ class MainWindow(QMainWindow):
 
     def _open_smart_playlist(self, label: str) -> None:
         self._select_tab("Playlists")
-        for i in range(self.playlists_tab.smart_list.count()):
-            item = self.playlists_tab.smart_list.item(i)
-            if item.text() == label:
-                self.playlists_tab.smart_list.setCurrentRow(i)
-                break
+        if self.playlists_tab is None:
+            return
+        row = self.playlists_tab.smart_list_index_by_text.get(label)
+        if row is not None:
+            self.playlists_tab.smart_list.setCurrentRow(row)
 
     def _show_missing_metadata(self) -> None:
-        rows = self.library_store.find_missing_metadata()
+        # Only the first 30 are listed; the rest are just counted.
+        missing = self.library_store.iter_missing_metadata()
+        rows = list(itertools.islice(missing, 30))
         if not rows:
             QMessageBox.information(self, "Tagging Tools", "No files with missing metadata found.")
             return
 
-        lines = [f"• {Path(r.get('path', '')).name}" for r in rows[:30]]
-        if len(rows) > 30:
-            lines.append(f"... and {len(rows) - 30} more")
+        lines = [f"• {os.path.basename(r.get('path', ''))}" for r in rows]
+        more = sum(1 for _ in missing)
+        if more:
+            lines.append(f"... and {more} more")
         QMessageBox.information(self, "Missing Metadata", "\n".join(lines))
 
     def _activate_podcasts_from_new_tab(self) -> None:
@@ -641,10 +911,9 @@ class MainWindow(QMainWindow):
         self._select_tab("New Tab")
 
     def _select_tab(self, name: str) -> None:
-        for idx in range(self.tabs.count()):
-            if self.tabs.tabText(idx) == name:
-                self.tabs.setCurrentIndex(idx)
-                return
+        idx = self._tab_index_by_name.get(name)
+        if idx is not None:
+            self.tabs.setCurrentIndex(idx)
 
 
 def _pin_to_dock() -> int:
@@ -662,15 +931,13 @@ def _pin_to_dock() -> int:
         print(f"Failed to read GNOME favorites: {exc}")
         return 1
 
-    try:
-        favorites = ast.literal_eval(raw)
-    except Exception:
-        print("Could not parse GNOME favorites list.")
-        return 1
-
-    if not isinstance(favorites, list):
+    # gsettings prints a GVariant string array: ['a.desktop', 'b.desktop'],
+    # or "@as []" when empty. Desktop ids never contain quotes.
+    raw = raw.removeprefix("@as ")
+    if not (raw.startswith("[") and raw.endswith("]")):
         print("Unexpected GNOME favorites format.")
         return 1
+    favorites = re.findall(r"'([^']*)'", raw)
 
     for desktop_id in desktop_ids:
         if desktop_id in favorites:
@@ -700,9 +967,11 @@ def main() -> int:
     app.setApplicationDisplayName("Groov")
     app.setOrganizationName("keegan")
     app.setDesktopFileName("Groov")
-    app.setWindowIcon(_app_icon())
+    icon = _app_icon()
+    app.setWindowIcon(icon)
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_KB)
 
-    splash = StartupSplash()
+    splash = StartupSplash(icon)
     splash.show_centered(app)
     app.processEvents()
 
@@ -1,32 +1,54 @@
 from __future__ import annotations
 
+from typing import Callable
+
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QMenuBar
 
 
+_PLAYLIST_ACTIONS = (
+    ("add_playlist", "Add Playlist"),
+    None,
+    ("recently_added", "Recently Added"),
+    ("top_25", "Top 25 Most Played"),
+    ("favorites", "Favorites"),
+)
+
+
 class FileMenu:
     def __init__(self, menu_bar: QMenuBar) -> None:
         menu = menu_bar.addMenu("File")
 
         self.add_folder = QAction("Add Folder", menu)
-        self.add_file = QAction("Add File", menu)
+        self.add_file = QAction("Add Files", menu)
         self.stream_url = QAction("Stream URL", menu)
         self.remove_folder = QAction("Remove Folder", menu)
 
         menu.addAction(self.add_folder)
         menu.addAction(self.add_file)
 
-        playlists = menu.addMenu("Playlists")
-        self.add_playlist = QAction("Add Playlist", playlists)
-        self.recently_added = QAction("Recently Added", playlists)
-        self.top_25 = QAction("Top 25 Most Played", playlists)
-        self.favorites = QAction("Favorites", playlists)
-        playlists.addAction(self.add_playlist)
-        playlists.addSeparator()
-        playlists.addAction(self.recently_added)
-        playlists.addAction(self.top_25)
-        playlists.addAction(self.favorites)
+        # The submenu's actions are only built the first time it opens; callers
+        # register their slots by action name in playlist_handlers.
+        self.playlist_handlers: dict[str, Callable[[], None]] = {}
+        self._playlists_built = False
+        self.playlists = menu.addMenu("Playlists")
+        self.playlists.aboutToShow.connect(self._build_playlists)
 
         menu.addSeparator()
         menu.addAction(self.stream_url)
         menu.addAction(self.remove_folder)
+
+    def _build_playlists(self) -> None:
+        if self._playlists_built:
+            return
+        self._playlists_built = True
+        for entry in _PLAYLIST_ACTIONS:
+            if entry is None:
+                self.playlists.addSeparator()
+                continue
+            name, label = entry
+            action = QAction(label, self.playlists)
+            handler = self.playlist_handlers.get(name)
+            if handler is not None:
+                action.triggered.connect(handler)
+            self.playlists.addAction(action)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Callable
+
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QMenuBar
 
@@ -7,6 +9,17 @@ from PySide6.QtWidgets import QMenuBar
 class ToolsMenu:
     def __init__(self, menu_bar: QMenuBar) -> None:
         menu = menu_bar.addMenu("Tools")
-        tagging = menu.addMenu("Tagging Tools")
-        self.show_missing_metadata = QAction("Show files with missing metadata", tagging)
-        tagging.addAction(self.show_missing_metadata)
+        # Built on first open; the handler is registered before that by the window.
+        self.show_missing_metadata_handler: Callable[[], None] | None = None
+        self._tagging_built = False
+        self.tagging = menu.addMenu("Tagging Tools")
+        self.tagging.aboutToShow.connect(self._build_tagging)
+
+    def _build_tagging(self) -> None:
+        if self._tagging_built:
+            return
+        self._tagging_built = True
+        action = QAction("Show files with missing metadata", self.tagging)
+        if self.show_missing_metadata_handler is not None:
+            action.triggered.connect(self.show_missing_metadata_handler)
+        self.tagging.addAction(action)
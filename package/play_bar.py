@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Sequence
 
-from PySide6.QtCore import QPointF, Qt, Signal
+from PySide6.QtCore import QPointF, QRect, Qt, QTimer, Signal, Slot
 from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -13,6 +14,16 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+try:
+    from .ui_utils import scaled_cover
+except ImportError:
+    from ui_utils import scaled_cover
+
+
+_VOLUME_EMIT_MS = 30
+_VOLUME_ICON_SIZE = 20
+_STATUS_ICONS_DIR = Path(__file__).resolve().parent.parent / "assets" / "status icons"
+
 
 def format_time(seconds: float) -> str:
     total = max(0, int(seconds))
@@ -28,44 +39,67 @@ class TinyGridVu(QWidget):
         self._rows = rows
         self._gain = 1.8
         self._levels = [0.0] * columns
+        self._off = QColor("#2f333c")
+        self._on = QColor("#4ad66d")
+        self._peak = QColor("#f2c14e")
+        # Cell rectangles per column, bottom row first; rebuilt on resize.
+        self._cells: list[list[QRect]] = []
         self.setFixedSize(88, 34)
+        self._layout_cells()
 
-    def set_levels(self, values: list[float]) -> None:
-        if not values:
+    def set_levels(self, values: Sequence[float]) -> None:
+        # Imported here, not at module level: main.py loads the play bar before
+        # the splash paints, and numpy is one of the imports deferred past it.
+        import numpy as np
+
+        if len(values) == 0:
             self._levels = [0.0] * self._columns
             self.update()
             return
-        step = max(1, len(values) // self._columns)
-        out: list[float] = []
-        for i in range(self._columns):
-            chunk = values[i * step : (i + 1) * step]
-            raw = (sum(chunk) / len(chunk)) if chunk else 0.0
-            out.append(max(0.0, min(1.0, raw * self._gain)))
-        self._levels = out
+        # Average equal-width chunks per column; with fewer bands than columns
+        # the trailing columns are zero-padded.
+        columns = self._columns
+        step = max(1, len(values) // columns)
+        arr = np.asarray(values, dtype=np.float32)[: columns * step]
+        if arr.size < columns * step:
+            arr = np.concatenate((arr, np.zeros(columns * step - arr.size, dtype=np.float32)))
+        out = arr.reshape(columns, step).mean(axis=1)
+        out *= self._gain
+        np.clip(out, 0.0, 1.0, out=out)
+        self._levels = out.tolist()
         self.update()
 
-    def paintEvent(self, event) -> None:  # type: ignore[override]
-        painter = QPainter(self)
-        painter.setPen(Qt.PenStyle.NoPen)
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        self._layout_cells()
+
+    def _layout_cells(self) -> None:
         rect = self.rect().adjusted(1, 1, -1, -1)
         cw = rect.width() / self._columns
         ch = rect.height() / self._rows
+        w = max(1, int(cw - 2))
+        h = max(1, int(ch - 2))
+        self._cells = [
+            [
+                QRect(int(rect.left() + col * cw + 1), int(rect.bottom() - (row + 1) * ch + 1), w, h)
+                for row in range(self._rows)
+            ]
+            for col in range(self._columns)
+        ]
 
-        off = QColor("#2f333c")
-        on = QColor("#4ad66d")
-        peak = QColor("#f2c14e")
-
-        for col in range(self._columns):
-            active = int(max(0.0, min(1.0, self._levels[col])) * self._rows)
-            for row in range(self._rows):
-                x = int(rect.left() + col * cw + 1)
-                y = int(rect.bottom() - (row + 1) * ch + 1)
-                w = max(1, int(cw - 2))
-                h = max(1, int(ch - 2))
-                color = off
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        painter = QPainter(self)
+        painter.setPen(Qt.PenStyle.NoPen)
+        rows = self._rows
+        off, on, peak = self._off, self._on, self._peak
+        # Levels are already clamped to 0..1 by set_levels.
+        for level, cells in zip(self._levels, self._cells):
+            active = int(level * rows)
+            for row, cell in enumerate(cells):
                 if row < active:
-                    color = peak if row >= self._rows - 1 else on
-                painter.fillRect(x, y, w, h, color)
+                    painter.fillRect(cell, peak if row == rows - 1 else on)
+                else:
+                    painter.fillRect(cell, off)
 
 
 class PlayBar(QWidget):
@@ -75,14 +109,20 @@ class PlayBar(QWidget):
     seek_requested = Signal(float)
     volume_changed = Signal(float)
 
+    _volume_pixmap_cache: dict[bool, QPixmap] | None = None
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._duration = 0.0
         self._is_playing = False
         self._seeking = False
-        assets_dir = Path(__file__).resolve().parent.parent / "assets" / "status icons"
-        self._music_on_icon = QPixmap(str(assets_dir / "music_on.png"))
-        self._music_off_icon = QPixmap(str(assets_dir / "music_off.png"))
+        # Last values pushed to the timeline; ticks that round to the same
+        # millisecond/second leave the widgets alone.
+        self._last_pos_ms = -1
+        self._last_dur_ms = 0
+        self._last_time_text = "00:00 / 00:00"
+        self._shown_cover_key = 0
+        self._placeholder: QPixmap | None = None
 
         self.setObjectName("playBar")
         self.setStyleSheet(
@@ -120,11 +160,19 @@ class PlayBar(QWidget):
         self.next_btn.clicked.connect(self.next_clicked)
 
         self.volume_icon = QLabel()
-        self.volume_icon.setFixedSize(20, 20)
+        self.volume_icon.setFixedSize(_VOLUME_ICON_SIZE, _VOLUME_ICON_SIZE)
+        self._volume_pixmaps = self._load_volume_pixmaps()
+        self._volume_muted: bool | None = None
+        self._pending_volume = 75
+        self._volume_timer = QTimer(self)
+        self._volume_timer.setSingleShot(True)
+        self._volume_timer.setInterval(_VOLUME_EMIT_MS)
+        self._volume_timer.timeout.connect(self._emit_volume)
         self.volume_slider = QSlider(Qt.Orientation.Horizontal)
         self.volume_slider.setRange(0, 100)
         self.volume_slider.setValue(75)
         self.volume_slider.valueChanged.connect(self._on_volume_changed)
+        self.volume_slider.sliderReleased.connect(self._emit_volume)
         self.volume_value = QLabel("75")
 
         controls = QHBoxLayout()
@@ -166,20 +214,45 @@ class PlayBar(QWidget):
 
         self._update_volume_icon(75)
 
+    @classmethod
+    def _load_volume_pixmaps(cls) -> dict[bool, QPixmap]:
+        # Decoded and scaled once per process; the icon label is fixed-size.
+        if cls._volume_pixmap_cache is None:
+            cls._volume_pixmap_cache = {}
+            for muted, name in ((False, "music_on.png"), (True, "music_off.png")):
+                pix = QPixmap(str(_STATUS_ICONS_DIR / name))
+                if not pix.isNull():
+                    cls._volume_pixmap_cache[muted] = pix.scaled(
+                        _VOLUME_ICON_SIZE,
+                        _VOLUME_ICON_SIZE,
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation,
+                    )
+        return cls._volume_pixmap_cache
+
     def set_track_info(self, title: str, artist: str, cover_path: str = "") -> None:
         self.title.setText(title or "Unknown Title")
         self.artist.setText(artist or "Unknown Artist")
 
-        pix = QPixmap(cover_path) if cover_path else QPixmap()
+        pix = scaled_cover(cover_path, self.cover.size())
         if pix.isNull():
-            pix = QPixmap(self.cover.size())
-            pix.fill(QColor("#2a2f39"))
-            painter = QPainter(pix)
-            painter.setPen(QPen(QColor("#5b6270"), 2))
-            painter.drawLine(QPointF(8, 8), QPointF(44, 44))
-            painter.drawLine(QPointF(44, 8), QPointF(8, 44))
-            painter.end()
-        self.cover.setPixmap(pix.scaled(self.cover.size(), Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation))
+            if self._placeholder is None:
+                self._placeholder = self._make_placeholder_cover()
+            pix = self._placeholder
+        # Consecutive tracks off one album share a cover; leave the label alone.
+        if pix.cacheKey() != self._shown_cover_key:
+            self._shown_cover_key = pix.cacheKey()
+            self.cover.setPixmap(pix)
+
+    def _make_placeholder_cover(self) -> QPixmap:
+        pix = QPixmap(self.cover.size())
+        pix.fill(QColor("#2a2f39"))
+        painter = QPainter(pix)
+        painter.setPen(QPen(QColor("#5b6270"), 2))
+        painter.drawLine(QPointF(8, 8), QPointF(44, 44))
+        painter.drawLine(QPointF(44, 8), QPointF(8, 44))
+        painter.end()
+        return pix
 
     def set_playing(self, playing: bool) -> None:
         self._is_playing = playing
@@ -188,35 +261,55 @@ class PlayBar(QWidget):
     def set_position(self, position: float, duration: float) -> None:
         self._duration = max(duration, 0.0)
         if not self._seeking:
-            self.progress.setRange(0, int(self._duration * 1000))
-            self.progress.setValue(int(max(position, 0.0) * 1000))
-        self.time_label.setText(f"{format_time(position)} / {format_time(duration)}")
-
-    def update_spectrum(self, values: list[float]) -> None:
+            dur_ms = int(self._duration * 1000)
+            pos_ms = int(max(position, 0.0) * 1000)
+            if dur_ms != self._last_dur_ms:
+                self._last_dur_ms = dur_ms
+                self._last_pos_ms = -1
+                self.progress.setRange(0, dur_ms)
+            if pos_ms != self._last_pos_ms:
+                self._last_pos_ms = pos_ms
+                self.progress.setValue(pos_ms)
+        text = f"{format_time(position)} / {format_time(duration)}"
+        if text != self._last_time_text:
+            self._last_time_text = text
+            self.time_label.setText(text)
+
+    def update_spectrum(self, values: Sequence[float]) -> None:
         self.vu.set_levels(values)
 
+    @Slot()
     def _on_seek_start(self) -> None:
         self._seeking = True
 
+    @Slot()
     def _on_seek_end(self) -> None:
         self._seeking = False
+        self._last_pos_ms = -1
         self.seek_requested.emit(self.progress.value() / 1000.0)
 
+    @Slot(int)
     def _on_volume_changed(self, value: int) -> None:
         self.volume_value.setText(str(value))
         self._update_volume_icon(value)
-        self.volume_changed.emit(value / 100.0)
+        # Drags fire per pixel; the engine only needs the latest value every few ms.
+        self._pending_volume = value
+        if not self._volume_timer.isActive():
+            self._volume_timer.start()
+
+    @Slot()
+    def _emit_volume(self) -> None:
+        self._volume_timer.stop()
+        self.volume_changed.emit(self._pending_volume / 100.0)
 
     def _update_volume_icon(self, value: int) -> None:
-        pix = self._music_off_icon if value == 0 else self._music_on_icon
-        if pix.isNull():
-            self.volume_icon.setText("🔇" if value == 0 else "🔊")
+        muted = value == 0
+        if muted == self._volume_muted:
+            return
+        self._volume_muted = muted
+        pix = self._volume_pixmaps.get(muted)
+        if pix is None:
+            self.volume_icon.setText("🔇" if muted else "🔊")
             return
         self.volume_icon.setText("")
-        self.volume_icon.setPixmap(
-            pix.scaled(
-                self.volume_icon.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-        )
+        self.volume_icon.setPixmap(pix)
@@ -1,88 +1,130 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal
+from typing import Any
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
-    QHBoxLayout,
+    QAbstractItemView,
     QHeaderView,
     QLineEdit,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
+try:
+    from ..ui_utils import format_duration
+except ImportError:
+    from ui_utils import format_duration
 
-def _fmt_duration(seconds: float) -> str:
-    total = max(0, int(seconds))
-    return f"{total // 60:02d}:{total % 60:02d}"
 
+_FILTER_DELAY_MS = 150
+_COLUMNS = (("Title", "title"), ("Artist", "artist"), ("Album", "album"), ("Duration", "duration"))
 
-class LibraryTab(QWidget):
-    track_double_clicked = Signal(dict)
 
+class TracksTableModel(QAbstractTableModel):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._tracks: list[dict] = []
+        self._search_index: list[str] = []
+
+    def set_tracks(self, tracks: list[dict]) -> None:
+        self.beginResetModel()
+        self._tracks = sorted(tracks, key=lambda t: (t.get("title") or "").lower())
+        self._search_index = [
+            f"{t.get('title') or ''} {t.get('artist') or ''} {t.get('album') or ''}".lower()
+            for t in self._tracks
+        ]
+        self.endResetModel()
+
+    def matches(self, row: int, query: str) -> bool:
+        return query in self._search_index[row]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tracks)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        track = self._tracks[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            key = _COLUMNS[index.column()][1]
+            if key == "duration":
+                return format_duration(int(float(track.get("duration", 0.0))))
+            return str(track.get(key, ""))
+        if role == Qt.ItemDataRole.UserRole and index.column() == 0:
+            return track
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return _COLUMNS[section][0]
+        return super().headerData(section, orientation, role)
+
+
+class _TrackFilterProxy(QSortFilterProxyModel):
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._query = ""
+
+    def set_query(self, query: str) -> None:
+        query = query.strip().lower()
+        if query != self._query:
+            self._query = query
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        return not self._query or self.sourceModel().matches(source_row, self._query)
+
+
+class LibraryTab(QWidget):
+    track_double_clicked = Signal(object)
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.model = TracksTableModel(self)
+        self.proxy = _TrackFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
 
         self.search = QLineEdit()
         self.search.setPlaceholderText("Search title, artist, album...")
-        self.search.textChanged.connect(self._render)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(_FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.search.textChanged.connect(self._filter_timer.start)
 
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["Title", "Artist", "Album", "Duration"])
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        # The model is already in title order; leave the proxy unsorted until a
+        # header click so filtering never pays for a re-sort.
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.table.setSortingEnabled(True)
-        self.table.cellDoubleClicked.connect(self._on_cell_double_clicked)
+        self.table.doubleClicked.connect(self._on_double_clicked)
 
         layout = QVBoxLayout(self)
         layout.addWidget(self.search)
         layout.addWidget(self.table, 1)
 
     def set_tracks(self, tracks: list[dict]) -> None:
-        self._tracks = sorted(tracks, key=lambda t: (t.get("title") or "").lower())
-        self._render()
-
-    def _render(self) -> None:
-        query = self.search.text().strip().lower()
-        filtered = []
-        if not query:
-            filtered = self._tracks
-        else:
-            for track in self._tracks:
-                text = " ".join(
-                    [
-                        str(track.get("title", "")),
-                        str(track.get("artist", "")),
-                        str(track.get("album", "")),
-                    ]
-                ).lower()
-                if query in text:
-                    filtered.append(track)
-
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(len(filtered))
-        for row, track in enumerate(filtered):
-            title = QTableWidgetItem(track.get("title", ""))
-            artist = QTableWidgetItem(track.get("artist", ""))
-            album = QTableWidgetItem(track.get("album", ""))
-            duration = QTableWidgetItem(_fmt_duration(float(track.get("duration", 0.0))))
-            title.setData(Qt.ItemDataRole.UserRole, track)
-            self.table.setItem(row, 0, title)
-            self.table.setItem(row, 1, artist)
-            self.table.setItem(row, 2, album)
-            self.table.setItem(row, 3, duration)
-        self.table.setSortingEnabled(True)
-        self.table.sortItems(0, Qt.SortOrder.AscendingOrder)
-
-    def _on_cell_double_clicked(self, row: int, _column: int) -> None:
-        item = self.table.item(row, 0)
-        if item is None:
-            return
-        track = item.data(Qt.ItemDataRole.UserRole)
-        if isinstance(track, dict):
+        self.model.set_tracks(tracks)
+
+    @Slot()
+    def _apply_filter(self) -> None:
+        self.proxy.set_query(self.search.text())
+
+    @Slot(QModelIndex)
+    def _on_double_clicked(self, index: QModelIndex) -> None:
+        track = self.proxy.index(index.row(), 0).data(Qt.ItemDataRole.UserRole)
+        if track is not None:
             self.track_double_clicked.emit(track)
@@ -1,32 +1,69 @@
 from __future__ import annotations
 
+import heapq
 from collections import defaultdict
+from typing import Any
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QStringListModel, Qt, Signal, Slot
 from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
     QGridLayout,
     QGroupBox,
     QHeaderView,
     QLabel,
+    QListView,
     QListWidget,
     QListWidgetItem,
+    QAbstractItemView,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QHBoxLayout,
 )
 
+try:
+    from ..ui_utils import cached_pixmap, scaled_cover
+except ImportError:
+    from ui_utils import cached_pixmap, scaled_cover
 
-def _fmt_duration(seconds: float) -> str:
-    total = max(0, int(seconds))
-    return f"{total // 60:02d}:{total % 60:02d}"
+
+_TOP_TRACKS = 25
+_ALBUM_HEADERS = ("Album", "Tracks", "Plays")
+
+
+class AlbumsModel(QAbstractTableModel):
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._rows: list[tuple[str, int, int]] = []
+
+    def set_rows(self, rows: list[tuple[str, int, int]]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def album_at(self, row: int) -> str:
+        return self._rows[row][0]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_ALBUM_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return str(self._rows[index.row()][index.column()])
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return _ALBUM_HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 
 class MusicExplorerTab(QWidget):
-    album_play_requested = Signal(list, bool)
+    album_play_requested = Signal(object, bool)
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -34,6 +71,13 @@ class MusicExplorerTab(QWidget):
         self._play_counts: dict[str, int] = {}
         self._artists: dict[str, list[dict]] = {}
         self._albums_by_artist: dict[str, dict[str, list[dict]]] = {}
+        self._sorted_albums_by_artist: dict[str, list[str]] = {}
+        # Play totals are kept per artist and album so selection never re-sums tracks.
+        self._artist_plays: dict[str, int] = {}
+        self._album_plays: dict[tuple[str, str], int] = {}
+        self._track_keys: dict[str, tuple[str, str]] = {}
+        # Set when a play count changed while hidden; the artist view refreshes on show.
+        self._artist_view_stale = False
 
         self.counters = {
             "Artists": QLabel("0"),
@@ -51,8 +95,12 @@ class MusicExplorerTab(QWidget):
             inner.addWidget(label)
             counter_layout.addWidget(box, 0, idx)
 
-        self.artists_list = QListWidget()
-        self.artists_list.currentItemChanged.connect(self._on_artist_selected)
+        self._artists_model = QStringListModel(self)
+        self.artists_list = QListView()
+        self.artists_list.setModel(self._artists_model)
+        self.artists_list.setUniformItemSizes(True)
+        self.artists_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.artists_list.selectionModel().currentChanged.connect(self._on_artist_selected)
 
         self.albums_list = QListWidget()
         self.albums_list.itemDoubleClicked.connect(self._play_selected_album)
@@ -81,13 +129,14 @@ class MusicExplorerTab(QWidget):
         header_right.addStretch(1)
         header.addLayout(header_right, 1)
 
-        self.albums_table = QTableWidget(0, 3)
-        self.albums_table.setHorizontalHeaderLabels(["Album", "Tracks", "Plays"])
+        self.albums_model = AlbumsModel(self)
+        self.albums_table = QTableView()
+        self.albums_table.setModel(self.albums_model)
         self.albums_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.albums_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         self.albums_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        self.albums_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.albums_table.cellDoubleClicked.connect(self._play_album_from_table)
+        self.albums_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.albums_table.doubleClicked.connect(self._play_album_from_table)
 
         center = QWidget()
         center_layout = QVBoxLayout(center)
@@ -116,24 +165,41 @@ class MusicExplorerTab(QWidget):
         layout.addWidget(split, 1)
 
     def set_tracks(self, tracks: list[dict], play_counts: dict[str, int] | None = None) -> None:
-        self._play_counts = play_counts or {}
+        # A private copy: the store's dict is bumped before bump_play_count runs,
+        # and the totals need the previous count to work out the delta.
+        pc = self._play_counts = dict(play_counts or {})
         self._tracks = tracks
 
         artists = defaultdict(list)
         albums_by_artist: dict[str, dict[str, list[dict]]] = {}
         global_albums = set()
+        artist_plays: dict[str, int] = defaultdict(int)
+        album_plays: dict[tuple[str, str], int] = defaultdict(int)
+        track_keys: dict[str, tuple[str, str]] = {}
 
         for track in tracks:
             artist = str(track.get("artist") or "Unknown Artist")
             album = str(track.get("album") or "Unknown Album")
+            path = str(track.get("path") or "")
             artists[artist].append(track)
             albums_by_artist.setdefault(artist, defaultdict(list))[album].append(track)
             global_albums.add(album)
+            plays = pc.get(path, 0)
+            artist_plays[artist] += plays
+            album_plays[(artist, album)] += plays
+            track_keys[path] = (artist, album)
+
+        self._artist_plays = dict(artist_plays)
+        self._album_plays = dict(album_plays)
+        self._track_keys = track_keys
 
         self._artists = dict(artists)
         self._albums_by_artist = {
             a: dict(albums) for a, albums in albums_by_artist.items()
         }
+        self._sorted_albums_by_artist = {
+            a: sorted(albums, key=str.lower) for a, albums in albums_by_artist.items()
+        }
 
         composers = {t.get("composer", "") for t in tracks if t.get("composer", "")}
         self.counters["Artists"].setText(str(len(self._artists)))
@@ -141,56 +207,78 @@ class MusicExplorerTab(QWidget):
         self.counters["Tracks"].setText(str(len(tracks)))
         self.counters["Composers"].setText(str(len(composers)))
 
-        self.artists_list.clear()
-        for artist in sorted(self._artists.keys(), key=str.lower):
-            self.artists_list.addItem(artist)
+        self._artists_model.setStringList(sorted(self._artists.keys(), key=str.lower))
 
-        if self.artists_list.count() > 0:
-            self.artists_list.setCurrentRow(0)
+        # The first artist's detail is built when the tab is actually shown.
+        if self._artists and self.isVisible():
+            self.artists_list.setCurrentIndex(self._artists_model.index(0))
         else:
             self._reset_artist_view()
 
+    def bump_play_count(self, path: str, count: int) -> None:
+        delta = count - self._play_counts.get(path, 0)
+        self._play_counts[path] = count
+        key = self._track_keys.get(path)
+        if key is None:
+            return
+        self._artist_plays[key[0]] = self._artist_plays.get(key[0], 0) + delta
+        self._album_plays[key] = self._album_plays.get(key, 0) + delta
+        # Only the selected artist's view shows counts.
+        if self._current_artist() != key[0]:
+            return
+        if self.isVisible():
+            self._on_artist_selected()
+        else:
+            self._artist_view_stale = True
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        if self._artists_model.rowCount() and not self.artists_list.currentIndex().isValid():
+            self.artists_list.setCurrentIndex(self._artists_model.index(0))
+        elif self._artist_view_stale:
+            self._artist_view_stale = False
+            self._on_artist_selected()
+
+    def _current_artist(self) -> str | None:
+        index = self.artists_list.currentIndex()
+        return index.data() if index.isValid() else None
+
+    @Slot()
     def _on_artist_selected(self) -> None:
-        item = self.artists_list.currentItem()
-        if item is None:
+        self._artist_view_stale = False
+        artist = self._current_artist()
+        if artist is None:
             self._reset_artist_view()
             return
 
-        artist = item.text()
         artist_tracks = self._artists.get(artist, [])
         albums = self._albums_by_artist.get(artist, {})
+        sorted_albums = self._sorted_albums_by_artist.get(artist, [])
 
         self.artist_name.setText(artist)
-        plays = sum(self._play_counts.get(str(t.get("path") or ""), 0) for t in artist_tracks)
+        plays = self._artist_plays.get(artist, 0)
         self.artist_stats.setText(
             f"Plays:{plays} • {len(albums)} Albums / {len(artist_tracks)} Tracks"
         )
         self._set_artist_cover(artist_tracks)
 
         self.albums_list.clear()
-        for album in sorted(albums.keys(), key=str.lower):
-            self.albums_list.addItem(album)
-
-        self.albums_table.setRowCount(len(albums))
-        for row, album in enumerate(sorted(albums.keys(), key=str.lower)):
-            tracks = albums[album]
-            album_plays = sum(self._play_counts.get(str(t.get("path") or ""), 0) for t in tracks)
-            album_item = QTableWidgetItem(album)
-            album_item.setData(Qt.ItemDataRole.UserRole, album)
-            self.albums_table.setItem(row, 0, album_item)
-            self.albums_table.setItem(row, 1, QTableWidgetItem(str(len(tracks))))
-            self.albums_table.setItem(row, 2, QTableWidgetItem(str(album_plays)))
-
-        top_tracks = sorted(
-            artist_tracks,
-            key=lambda t: self._play_counts.get(str(t.get("path") or ""), 0),
-            reverse=True,
+        self.albums_list.addItems(sorted_albums)
+
+        self.albums_model.set_rows(
+            [
+                (album, len(albums[album]), self._album_plays.get((artist, album), 0))
+                for album in sorted_albums
+            ]
         )
+
+        pc = self._play_counts
+        counted = [(pc.get(str(t.get("path") or ""), 0), t) for t in artist_tracks]
+        top_tracks = heapq.nlargest(_TOP_TRACKS, counted, key=lambda pair: pair[0])
         self.top_tracks_list.clear()
-        for track in top_tracks[:25]:
-            plays_count = self._play_counts.get(str(track.get("path") or ""), 0)
-            label = f"{track.get('title', 'Unknown Title')} ({plays_count})"
-            self.top_tracks_list.addItem(label)
+        self.top_tracks_list.addItems(
+            [f"{track.get('title', 'Unknown Title')} ({plays})" for plays, track in top_tracks]
+        )
 
     def _set_artist_cover(self, tracks: list[dict]) -> None:
         cover_path = ""
@@ -200,42 +288,37 @@ class MusicExplorerTab(QWidget):
                 cover_path = p
                 break
 
-        pix = QPixmap(cover_path)
+        size = self.artist_cover.size()
+        pix = scaled_cover(cover_path, size)
         if pix.isNull():
-            pix = QPixmap(self.artist_cover.size())
-            pix.fill(QColor("#232730"))
-            p = QPainter(pix)
-            p.setPen(QPen(QColor("#5b6270"), 2))
-            p.drawRect(10, 10, pix.width() - 20, pix.height() - 20)
-            p.end()
-
-        self.artist_cover.setPixmap(
-            pix.scaled(
-                self.artist_cover.size(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-        )
-
+            pix = cached_pixmap(f"placeholder|artist|{size.width()}x{size.height()}", self._placeholder_cover)
+        self.artist_cover.setPixmap(pix)
+
+    def _placeholder_cover(self) -> QPixmap:
+        pix = QPixmap(self.artist_cover.size())
+        pix.fill(QColor("#232730"))
+        p = QPainter(pix)
+        p.setPen(QPen(QColor("#5b6270"), 2))
+        p.drawRect(10, 10, pix.width() - 20, pix.height() - 20)
+        p.end()
+        return pix
+
+    @Slot(QListWidgetItem)
     def _play_selected_album(self, item: QListWidgetItem) -> None:
-        artist_item = self.artists_list.currentItem()
-        if artist_item is None:
+        artist = self._current_artist()
+        if artist is None:
             return
-        artist = artist_item.text()
         album = item.text()
         tracks = self._albums_by_artist.get(artist, {}).get(album, [])
         if tracks:
             self.album_play_requested.emit(tracks, True)
 
-    def _play_album_from_table(self, row: int, _column: int) -> None:
-        artist_item = self.artists_list.currentItem()
-        if artist_item is None:
-            return
-        album_item = self.albums_table.item(row, 0)
-        if album_item is None:
+    @Slot(QModelIndex)
+    def _play_album_from_table(self, index: QModelIndex) -> None:
+        artist = self._current_artist()
+        if artist is None or not index.isValid():
             return
-        artist = artist_item.text()
-        album = str(album_item.data(Qt.ItemDataRole.UserRole) or album_item.text())
+        album = self.albums_model.album_at(index.row())
         tracks = self._albums_by_artist.get(artist, {}).get(album, [])
         if tracks:
             self.album_play_requested.emit(tracks, True)
@@ -244,6 +327,6 @@ class MusicExplorerTab(QWidget):
         self.artist_name.setText("No Artist")
         self.artist_stats.setText("Plays:0 • 0 Albums / 0 Tracks")
         self.albums_list.clear()
-        self.albums_table.setRowCount(0)
+        self.albums_model.set_rows([])
         self.top_tracks_list.clear()
         self._set_artist_cover([])
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
+import bisect
+import math
+import time
+from typing import Sequence
+
+import numpy as np
+from PySide6.QtCore import QRect, Qt, QTimer
+from PySide6.QtGui import QBrush, QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -12,54 +18,95 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+try:
+    from ..ui_utils import scaled_cover
+except ImportError:
+    from ui_utils import scaled_cover
+
+
+_CAP_DECAY = 0.02
+_COVER_SIZE = 180
+# With no new frame for this long (paused, stopped) the visualizer timer stops
+# once the peak caps have fallen back onto the bars.
+_SPECTRUM_IDLE_S = 0.25
+_BACKGROUND = QColor("#0f1115")
+_BAR_BRUSH = QBrush(QColor("#4ad66d"))
+_CAP_BRUSH = QBrush(QColor("#f2c14e"))
+
 
 class SpectrumVisualizer(QWidget):
     def __init__(self, bands: int = 128, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._bands = bands
-        self._values = [0.0] * bands
-        self._caps = [0.0] * bands
+        self._values = np.zeros(bands, dtype=np.float32)
+        self._caps = np.zeros(bands, dtype=np.float32)
+        # One rect per bar and per cap, reused every frame; x positions follow the width.
+        self._bar_rects = [QRect() for _ in range(bands)]
+        self._cap_rects = [QRect() for _ in range(bands)]
+        self._bar_xs: list[int] = []
+        self._bar_width = 1
         self.setMinimumHeight(130)
         self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
 
-    def set_values(self, values: list[float]) -> None:
-        if len(values) < self._bands:
-            values = values + [0.0] * (self._bands - len(values))
-        self._values = values[: self._bands]
-        for i in range(self._bands):
-            self._caps[i] = max(self._values[i], self._caps[i] - 0.02)
+    def set_values(self, values: Sequence[float] | np.ndarray) -> None:
+        # Copied into the preallocated buffer: short input pads with silence.
+        n = min(len(values), self._bands)
+        self._values[:n] = values[:n]
+        self._values[n:] = 0.0
+        self._caps -= _CAP_DECAY
+        np.maximum(self._values, self._caps, out=self._caps)
         self.update()
 
+    def caps_settled(self) -> bool:
+        return bool(np.array_equal(self._caps, self._values))
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        self._layout_bars()
+
+    def _layout_bars(self) -> None:
+        bar_w = max(1, self.width() / self._bands)
+        self._bar_xs = [int(i * bar_w) for i in range(self._bands)]
+        self._bar_width = max(1, int(bar_w - 1))
+
     def paintEvent(self, event) -> None:  # type: ignore[override]
         p = QPainter(self)
-        p.fillRect(self.rect(), QColor("#0f1115"))
+        p.fillRect(self.rect(), _BACKGROUND)
 
-        w = self.width()
         h = self.height()
-        bar_w = max(1, w / self._bands)
+        scale = h - 10
+        bw = self._bar_width
+        heights = (self._values.astype(np.float64) * scale).astype(np.int64).tolist()
+        cap_ys = (h - self._caps.astype(np.float64) * scale).astype(np.int64).tolist()
+        for bar, cap, x, bh, cap_y in zip(self._bar_rects, self._cap_rects, self._bar_xs, heights, cap_ys):
+            bar.setRect(x, h - bh, bw, bh)
+            cap.setRect(x, cap_y, bw, 2)
 
         p.setPen(Qt.PenStyle.NoPen)
-        for i, val in enumerate(self._values):
-            bh = int(val * (h - 10))
-            x = int(i * bar_w)
-            y = h - bh
-            p.setBrush(QColor("#4ad66d"))
-            p.drawRect(x, y, max(1, int(bar_w - 1)), bh)
-
-            cap_y = int(h - self._caps[i] * (h - 10))
-            p.setBrush(QColor("#f2c14e"))
-            p.drawRect(x, cap_y, max(1, int(bar_w - 1)), 2)
+        p.setBrush(_BAR_BRUSH)
+        p.drawRects(self._bar_rects)
+        p.setBrush(_CAP_BRUSH)
+        p.drawRects(self._cap_rects)
 
 
 class NowPlayingTab(QWidget):
+    _placeholder: QPixmap | None = None
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._lyrics: list[tuple[float, str]] = []
+        self._timestamps: list[float] = []
         self._active_lyric_index = -1
-        self._latest_spectrum: list[float] | None = None
+        # Positions in [start, end) keep the active line; empty until one is picked.
+        self._line_start = math.inf
+        self._line_end = -math.inf
+        # Raw analyzer frame; band remapping waits until it is actually drawn.
+        self._latest_spectrum: Sequence[float] | np.ndarray | None = None
+        self._last_spectrum_at = 0.0
+        self._shown_cover_key = 0
 
         self.cover = QLabel()
-        self.cover.setFixedSize(180, 180)
+        self.cover.setFixedSize(_COVER_SIZE, _COVER_SIZE)
         self.cover.setStyleSheet("background: #232730; border-radius: 8px;")
 
         self.title = QLabel("No Track")
@@ -87,7 +134,6 @@ class NowPlayingTab(QWidget):
         self._visualizer_timer = QTimer(self)
         self._visualizer_timer.setInterval(28)
         self._visualizer_timer.timeout.connect(self._render_latest_spectrum)
-        self._visualizer_timer.start()
 
         top = QHBoxLayout()
         top.addWidget(self.cover)
@@ -122,25 +168,36 @@ class NowPlayingTab(QWidget):
         self.album_year.setText(f"{album}{year_text}")
 
         cover_art_path = str(track.get("cover_art_path") or "")
-        pix = QPixmap(cover_art_path)
+        pix = scaled_cover(cover_art_path, self.cover.size())
         if pix.isNull():
-            pix = QPixmap(self.cover.size())
-            pix.fill(QColor("#232730"))
-            p = QPainter(pix)
-            p.setPen(QPen(QColor("#5b6270"), 2))
-            p.drawRect(12, 12, pix.width() - 24, pix.height() - 24)
-            p.end()
-        self.cover.setPixmap(
-            pix.scaled(
-                self.cover.size(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-        )
+            pix = self._placeholder_cover()
+        # The shared placeholder or an album's cover often repeats track to track.
+        if pix.cacheKey() != self._shown_cover_key:
+            self._shown_cover_key = pix.cacheKey()
+            self.cover.setPixmap(pix)
+
+    @classmethod
+    def _placeholder_cover(cls) -> QPixmap:
+        if cls._placeholder is None:
+            cls._placeholder = cls._make_placeholder_cover()
+        return cls._placeholder
+
+    @staticmethod
+    def _make_placeholder_cover() -> QPixmap:
+        pix = QPixmap(_COVER_SIZE, _COVER_SIZE)
+        pix.fill(QColor("#232730"))
+        p = QPainter(pix)
+        p.setPen(QPen(QColor("#5b6270"), 2))
+        p.drawRect(12, 12, pix.width() - 24, pix.height() - 24)
+        p.end()
+        return pix
 
     def set_lyrics(self, lines: list[tuple[float, str]]) -> None:
         self._lyrics = lines
+        self._timestamps = [ts for ts, _text in lines]
         self._active_lyric_index = -1
+        self._line_start = math.inf
+        self._line_end = -math.inf
         self.lyrics_list.clear()
         for _ts, text in lines:
             item = QListWidgetItem(text)
@@ -150,14 +207,16 @@ class NowPlayingTab(QWidget):
             self.lyrics_list.setCurrentRow(0)
 
     def set_position(self, position_seconds: float) -> None:
+        # Called many times per line; most ticks land inside the current one.
+        if self._line_start <= position_seconds < self._line_end:
+            return
         if not self._lyrics:
             return
-        idx = 0
-        for i, (timestamp, _text) in enumerate(self._lyrics):
-            if timestamp <= position_seconds:
-                idx = i
-            else:
-                break
+        # Lines are sorted by timestamp; before the first one, stay on line 0.
+        timestamps = self._timestamps
+        idx = max(0, bisect.bisect_right(timestamps, position_seconds) - 1)
+        self._line_start = timestamps[idx] if idx else -math.inf
+        self._line_end = timestamps[idx + 1] if idx + 1 < len(timestamps) else math.inf
         if idx == self._active_lyric_index:
             return
         self._active_lyric_index = idx
@@ -166,48 +225,64 @@ class NowPlayingTab(QWidget):
         if item is not None:
             self.lyrics_list.scrollToItem(item, QListWidget.ScrollHint.PositionAtCenter)
 
-    def set_spectrum(self, values: list[float]) -> None:
-        self._latest_spectrum = self._with_extra_low_bands(values)
+    def set_spectrum(self, values: Sequence[float]) -> None:
+        self._latest_spectrum = values
+        self._last_spectrum_at = time.monotonic()
+        if not self._visualizer_timer.isActive() and self.isVisible():
+            self._visualizer_timer.start()
 
     def set_visualizer_fps(self, fps: int) -> None:
         fps = max(8, min(60, int(fps)))
         self._visualizer_timer.setInterval(max(1, int(1000 / fps)))
 
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        if self._latest_spectrum is not None:
+            self._render_latest_spectrum()
+            self._visualizer_timer.start()
+
+    def hideEvent(self, event) -> None:  # type: ignore[override]
+        super().hideEvent(event)
+        self._visualizer_timer.stop()
+
     def _render_latest_spectrum(self) -> None:
-        if self._latest_spectrum is None:
+        if self._latest_spectrum is None or not self.visualizer.isVisible():
+            self._visualizer_timer.stop()
             return
-        self.visualizer.set_values(self._latest_spectrum)
+        self.visualizer.set_values(self._with_extra_low_bands(self._latest_spectrum))
+        # Idle: the last frame is redrawn only until the caps stop moving.
+        if time.monotonic() - self._last_spectrum_at > _SPECTRUM_IDLE_S and self.visualizer.caps_settled():
+            self._visualizer_timer.stop()
 
-    def _with_extra_low_bands(self, values: list[float]) -> list[float]:
-        if len(values) < 16:
-            return values[:]
+    def _with_extra_low_bands(self, values: Sequence[float] | np.ndarray) -> np.ndarray:
+        arr = np.asarray(values, dtype=np.float32)
+        total = arr.size
+        if total < 16:
+            return arr
 
-        total = len(values)
         # Allocate more on-screen bars to the lowest frequencies for clearer bass activity.
         low_source = max(4, int(total * 0.18))
         low_target = max(10, int(total * 0.30))
         low_target = min(low_target, total - 1)
 
-        lows = self._resample_bands(values[:low_source], low_target)
-        highs = self._resample_bands(values[low_source:], total - low_target)
-        return lows + highs
+        lows = self._resample_bands(arr[:low_source], low_target)
+        highs = self._resample_bands(arr[low_source:], total - low_target)
+        return np.concatenate((lows, highs))
 
     @staticmethod
-    def _resample_bands(values: list[float], target: int) -> list[float]:
+    def _resample_bands(values: np.ndarray, target: int) -> np.ndarray:
         if target <= 0:
-            return []
-        if not values:
-            return [0.0] * target
-        if len(values) == target:
-            return values[:]
-
-        n = len(values)
-        out: list[float] = []
-        for i in range(target):
-            start = int(i * n / target)
-            end = int((i + 1) * n / target)
-            if end <= start:
-                end = min(n, start + 1)
-            chunk = values[start:end]
-            out.append((sum(chunk) / len(chunk)) if chunk else values[min(start, n - 1)])
-        return out
+            return np.zeros(0, dtype=np.float32)
+        n = values.size
+        if n == 0:
+            return np.zeros(target, dtype=np.float32)
+        if n == target:
+            return values
+
+        # Bin i averages values[edges[i]:edges[i + 1]]; an empty bin (upsampling)
+        # reduces to the single value at its start, which is what it should repeat.
+        edges = np.arange(target + 1) * n // target
+        sums = np.add.reduceat(values, edges[:-1])
+        # Float32 counts keep the result float32 (the quotient rounds the same).
+        counts = np.diff(edges).clip(min=1).astype(np.float32)
+        return sums / counts
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import bisect
 from typing import Any
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QHBoxLayout,
@@ -13,16 +14,62 @@ from PySide6.QtWidgets import (
     QListWidgetItem,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
+try:
+    from ..ui_utils import format_duration
+except ImportError:
+    from ui_utils import format_duration
 
-def _fmt_duration(seconds: float) -> str:
-    total = max(0, int(seconds))
-    return f"{total // 60:02d}:{total % 60:02d}"
+
+# Smart list labels, in display order, and the playlists data key behind each.
+_SMART_KEYS = {
+    "Recently Added": "recently_added",
+    "Top 25 Most Played": "top_25_most_played",
+    "Favorites": "favorites",
+}
+
+_COLUMNS = ("Track", "Artist", "Album", "Duration", "Times Played")
+
+
+class PlaylistModel(QAbstractTableModel):
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._rows: list[tuple[str, ...]] = []
+
+    def set_rows(self, rows: list[tuple[str, ...]]) -> None:
+        old_rows = self._rows
+        if rows == old_rows:
+            return
+        if len(rows) != len(old_rows):
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        # Same length (play counts ticking, a track retagged): keep selection and
+        # scroll position and repaint just the span of rows that differ.
+        changed = [row for row, (new, old) in enumerate(zip(rows, old_rows)) if new != old]
+        self._rows = rows
+        self.dataChanged.emit(self.index(changed[0], 0), self.index(changed[-1], len(_COLUMNS) - 1))
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return _COLUMNS[section]
+        return super().headerData(section, orientation, role)
 
 
 class PlaylistsTab(QWidget):
@@ -33,12 +80,21 @@ class PlaylistsTab(QWidget):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self._tracks_by_path: dict[str, dict] = {}
+        # Per library path: the title/artist/album/duration cell texts and the
+        # duration in seconds, derived once per library sync. One entry, so a
+        # playlist path costs a single probe to resolve.
+        self._library: dict[str, tuple[tuple[str, str, str, str], float]] = {}
+        # Per path: (play count, full row) as last shown. Rows whose count hasn't
+        # moved are reused as-is, which also makes PlaylistModel's diff cheap.
+        self._row_cache: dict[str, tuple[int, tuple[str, ...]]] = {}
         self._data: dict[str, Any] = {}
         self._active_key: tuple[str, str] | None = None
+        # Mirrors custom_list; None until the first set_data.
+        self._sorted_playlist_names: list[str] | None = None
 
         self.smart_list = QListWidget()
-        self.smart_list.addItems(["Recently Added", "Top 25 Most Played", "Favorites"])
+        self.smart_list.addItems(list(_SMART_KEYS))
+        self.smart_list_index_by_text = {label: row for row, label in enumerate(_SMART_KEYS)}
         self.smart_list.currentItemChanged.connect(self._from_smart_selection)
 
         self.custom_list = QListWidget()
@@ -57,8 +113,9 @@ class PlaylistsTab(QWidget):
         self.title.setStyleSheet("font-size: 18px; font-weight: 700;")
         self.summary = QLabel("0 tracks • 00:00")
 
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(["Track", "Artist", "Album", "Duration", "Times Played"])
+        self.model = PlaylistModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
@@ -91,30 +148,80 @@ class PlaylistsTab(QWidget):
         layout.addLayout(right, 3)
 
     def set_library_tracks(self, tracks: list[dict]) -> None:
-        self._tracks_by_path = {t.get("path", ""): t for t in tracks}
+        library: dict[str, tuple[tuple[str, str, str, str], float]] = {}
+        for t in tracks:
+            seconds = float(t.get("duration", 0.0))
+            cells = (t.get("title", ""), t.get("artist", ""), t.get("album", ""), format_duration(int(seconds)))
+            library[t.get("path", "")] = (cells, seconds)
+        self._library = library
+        self._row_cache = {}
 
     def set_data(self, data: dict[str, Any]) -> None:
         self._data = data
-        self.custom_list.clear()
-        for name in sorted(data.get("playlists", {}).keys(), key=str.lower):
-            self.custom_list.addItem(name)
+        names = data.get("playlists", {}).keys()
+        # Most refreshes (play counts, smart lists) leave the playlist names alone.
+        if self._sorted_playlist_names is None or names != set(self._sorted_playlist_names):
+            self._sorted_playlist_names = sorted(names, key=str.casefold)
+            # One batched insert; a cleared list has no current item to report.
+            self.custom_list.blockSignals(True)
+            self.custom_list.setUpdatesEnabled(False)
+            self.custom_list.clear()
+            self.custom_list.addItems(self._sorted_playlist_names)
+            self.custom_list.setUpdatesEnabled(True)
+            self.custom_list.blockSignals(False)
 
         if self._active_key is None:
             self.smart_list.setCurrentRow(0)
         else:
             self._load_active()
 
+    def add_playlist_name(self, name: str) -> None:
+        names = self._sorted_playlist_names
+        if names is None:
+            names = self._sorted_playlist_names = []
+        row = bisect.bisect_right(names, name.casefold(), key=str.casefold)
+        names.insert(row, name)
+        self.custom_list.insertItem(row, name)
+
+    def remove_playlist_name(self, name: str) -> None:
+        for item in self.custom_list.findItems(name, Qt.MatchFlag.MatchExactly):
+            self.custom_list.blockSignals(True)
+            self.custom_list.takeItem(self.custom_list.row(item))
+            self.custom_list.blockSignals(False)
+        if self._sorted_playlist_names is not None and name in self._sorted_playlist_names:
+            self._sorted_playlist_names.remove(name)
+        self.refresh_playlist(name)
+
+    def rename_playlist_name(self, old_name: str, new_name: str) -> None:
+        self.custom_list.blockSignals(True)
+        for item in self.custom_list.findItems(old_name, Qt.MatchFlag.MatchExactly):
+            self.custom_list.takeItem(self.custom_list.row(item))
+        if self._sorted_playlist_names is not None and old_name in self._sorted_playlist_names:
+            self._sorted_playlist_names.remove(old_name)
+        self.add_playlist_name(new_name)
+        self.custom_list.blockSignals(False)
+        if self._active_key == ("custom", old_name):
+            self._active_key = ("custom", new_name)
+            self._load_active()
+
+    def refresh_playlist(self, name: str) -> None:
+        if self._active_key == ("custom", name):
+            self._load_active()
+
+    def refresh_smart(self, key: str) -> None:
+        if self._active_key == ("smart", key):
+            self._load_active()
+
+    def refresh_play_counts(self) -> None:
+        # The times-played column and the Top 25 list both depend on play counts.
+        if self._active_key is not None:
+            self._load_active()
+
     def _from_smart_selection(self) -> None:
         item = self.smart_list.currentItem()
         if item is None:
             return
-        label = item.text()
-        key_map = {
-            "Recently Added": "recently_added",
-            "Top 25 Most Played": "top_25_most_played",
-            "Favorites": "favorites",
-        }
-        key = key_map.get(label)
+        key = _SMART_KEYS.get(item.text())
         if not key:
             return
         self._active_key = ("smart", key)
@@ -143,9 +250,6 @@ class PlaylistsTab(QWidget):
         return self._data.get("playlists", {}).get(key, [])
 
     def _load_active(self) -> None:
-        paths = self._get_active_paths()
-        tracks = [self._tracks_by_path[p] for p in paths if p in self._tracks_by_path]
-
         if self._active_key is None:
             title = "No Playlist"
         elif self._active_key[0] == "smart":
@@ -158,18 +262,26 @@ class PlaylistsTab(QWidget):
         else:
             title = self._active_key[1]
 
-        duration = sum(float(t.get("duration", 0.0)) for t in tracks)
-        self.title.setText(title)
-        self.summary.setText(f"{len(tracks)} tracks • {_fmt_duration(duration)}")
-
+        library_get = self._library.get
         play_counts = self._data.get("play_counts", {})
-        self.table.setRowCount(len(tracks))
-        for row, track in enumerate(tracks):
-            self.table.setItem(row, 0, QTableWidgetItem(track.get("title", "")))
-            self.table.setItem(row, 1, QTableWidgetItem(track.get("artist", "")))
-            self.table.setItem(row, 2, QTableWidgetItem(track.get("album", "")))
-            self.table.setItem(row, 3, QTableWidgetItem(_fmt_duration(float(track.get("duration", 0.0)))))
-            self.table.setItem(row, 4, QTableWidgetItem(str(play_counts.get(track.get("path", ""), 0))))
+        row_cache = self._row_cache
+        rows = []
+        duration = 0.0
+        for p in self._get_active_paths():
+            entry = library_get(p)
+            if entry is None:
+                continue
+            cells, seconds = entry
+            duration += seconds
+            count = play_counts.get(p, 0)
+            cached = row_cache.get(p)
+            if cached is None or cached[0] != count:
+                cached = row_cache[p] = (count, cells + (str(count),))
+            rows.append(cached[1])
+
+        self.title.setText(title)
+        self.summary.setText(f"{len(rows)} tracks • {format_duration(int(duration))}")
+        self.model.set_rows(rows)
 
     def _play(self, shuffle: bool) -> None:
         paths = self._get_active_paths()
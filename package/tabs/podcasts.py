@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
-from urllib.request import urlopen
-
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -20,6 +17,9 @@ from PySide6.QtWidgets import (
 
 class PodcastsTab(QWidget):
     episode_play_requested = Signal(dict, list)
+    # The window fetches the feed off the GUI thread and answers with
+    # add_feed() or show_feed_error().
+    feed_requested = Signal(str)
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -56,16 +56,19 @@ class PodcastsTab(QWidget):
         if not ok or not url:
             return
 
-        try:
-            data = self._fetch_feed(url.strip())
-        except Exception as exc:
-            QMessageBox.warning(self, "Subscribe", f"Failed to load feed: {exc}")
-            return
+        self.subscribe_btn.setEnabled(False)
+        self.feed_requested.emit(url)
 
+    def add_feed(self, url: str, data: dict) -> None:
+        self.subscribe_btn.setEnabled(True)
         self._feeds[url] = data
         self.podcast_list.addItem(data.get("title", url))
         self.podcast_list.item(self.podcast_list.count() - 1).setData(Qt.ItemDataRole.UserRole, url)
 
+    def show_feed_error(self, _url: str, error: str) -> None:
+        self.subscribe_btn.setEnabled(True)
+        QMessageBox.warning(self, "Subscribe", f"Failed to load feed: {error}")
+
     def _unsubscribe(self) -> None:
         row = self.podcast_list.currentRow()
         if row < 0:
@@ -105,39 +108,3 @@ class PodcastsTab(QWidget):
             return
         queue = [episode]
         self.episode_play_requested.emit(episode, queue)
-
-    @staticmethod
-    def _fetch_feed(url: str) -> dict:
-        xml_text = urlopen(url, timeout=10).read().decode("utf-8", errors="ignore")
-        root = ET.fromstring(xml_text)
-
-        channel = root.find("channel")
-        if channel is None:
-            raise ValueError("Invalid RSS feed")
-
-        title = channel.findtext("title", default=url).strip()
-        episodes: list[dict] = []
-        for idx, item in enumerate(channel.findall("item"), start=1):
-            ep_title = item.findtext("title", default=f"Episode {idx}").strip()
-            enclosure = item.find("enclosure")
-            media_url = enclosure.attrib.get("url", "") if enclosure is not None else ""
-            duration = item.findtext("{http://www.itunes.com/dtds/podcast-1.0.dtd}duration", default="--:--")
-            episode_no = item.findtext("{http://www.itunes.com/dtds/podcast-1.0.dtd}episode", default=str(idx))
-            if not media_url:
-                continue
-            episodes.append(
-                {
-                    "path": media_url,
-                    "title": ep_title,
-                    "artist": title,
-                    "album": "Podcast",
-                    "year": "",
-                    "duration": 0.0,
-                    "cover_art_path": "",
-                    "composer": "",
-                    "episode": episode_no,
-                    "duration_label": duration,
-                }
-            )
-
-        return {"title": title, "episodes": episodes}
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import functools
+import os
+from typing import Callable
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QImageReader, QPixmap, QPixmapCache
+
+
+# Room for a few hundred scaled covers; QPixmapCache takes the limit in KiB.
+PIXMAP_CACHE_KB = 40 * 1024
+
+
+@functools.lru_cache(maxsize=8192)
+def format_duration(seconds: int) -> str:
+    # Keyed on whole seconds, so a library formats each distinct length once.
+    total = max(0, seconds)
+    return f"{total // 60:02d}:{total % 60:02d}"
+
+
+def scaled_cover(path: str, size: QSize) -> QPixmap:
+    # Decoded and scaled once per (path, mtime, size), so a cover rewritten in
+    # place is picked up; a null pixmap means no usable image.
+    if not path:
+        return QPixmap()
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return QPixmap()
+    key = f"cover|{path}|{mtime}|{size.width()}x{size.height()}"
+    pix = QPixmapCache.find(key)
+    if pix is not None:
+        return pix
+    reader = QImageReader(path)
+    full = reader.size()
+    if full.isValid():
+        target = full.scaled(size, Qt.AspectRatioMode.KeepAspectRatioByExpanding)
+        # Let the decoder produce the small image directly (JPEG scales while
+        # decoding) instead of decoding full-size artwork only to shrink it.
+        if target.width() < full.width():
+            reader.setScaledSize(target)
+    image = reader.read()
+    if image.isNull():
+        return QPixmap()
+    # Upscaling small art, or a format that couldn't report its size up front.
+    if image.size() != image.size().scaled(size, Qt.AspectRatioMode.KeepAspectRatioByExpanding):
+        image = image.scaled(
+            size,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+    pix = QPixmap.fromImage(image)
+    QPixmapCache.insert(key, pix)
+    return pix
+
+
+def cached_pixmap(key: str, build: Callable[[], QPixmap]) -> QPixmap:
+    pix = QPixmapCache.find(key)
+    if pix is None:
+        pix = build()
+        QPixmapCache.insert(key, pix)
+    return pix